@@ -9,6 +9,7 @@ from typing import Sequence, Union
 
 from alembic import op
 import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
 
 
 # revision identifiers, used by Alembic.
@@ -34,7 +35,14 @@ def upgrade() -> None:
         'cest',
         sa.Column('codigo', sa.String(7), primary_key=True),
         sa.Column('descricao', sa.Text(), nullable=False),
-        sa.Column('ncm_codigo', sa.String(8), nullable=False, index=True),
+        sa.Column('ncm_codigo', sa.String(8), nullable=False),
+    )
+    # Covering index: "CEST codes for an NCM" is served index-only
+    op.create_index(
+        'ix_cest_ncm_covering',
+        'cest',
+        ['ncm_codigo'],
+        postgresql_include=['codigo', 'descricao'],
     )
 
     op.create_table(
@@ -51,8 +59,8 @@ def upgrade() -> None:
 
     # ── Agent / AI tables ────────────────────────────────────────
 
-    skill_type_enum = sa.Enum('builtin', 'custom', 'llm', 'http', name='skill_type_enum')
-    chat_role_enum = sa.Enum('user', 'agent', 'skill', name='chat_role_enum')
+    # Closed value sets use VARCHAR + CHECK instead of native ENUM types:
+    # extending a CHECK is a cheap constraint swap, not an ALTER TYPE.
 
     op.create_table(
         'llm_providers',
@@ -62,7 +70,7 @@ def upgrade() -> None:
         sa.Column('model', sa.String(128), nullable=False),
         sa.Column('api_key_encrypted', sa.Text(), nullable=False),
         sa.Column('base_url', sa.Text(), nullable=True),
-        sa.Column('params', sa.JSON(), nullable=True),
+        sa.Column('params', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
         sa.Column('is_active', sa.Boolean(), nullable=False, server_default=sa.text('true')),
         sa.Column('created_at', sa.DateTime(timezone=True), nullable=True),
         sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
@@ -75,13 +83,17 @@ def upgrade() -> None:
         sa.Column('tenant_id', sa.String(36), nullable=True, index=True),
         sa.Column('name', sa.String(128), nullable=False),
         sa.Column('description', sa.Text(), nullable=True),
-        sa.Column('skill_type', skill_type_enum, nullable=False, server_default='builtin'),
+        sa.Column('skill_type', sa.String(16), nullable=False, server_default='builtin'),
         sa.Column('implementation', sa.Text(), nullable=True),
-        sa.Column('params_schema', sa.JSON(), nullable=True),
+        sa.Column('params_schema', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
         sa.Column('is_active', sa.Boolean(), nullable=False, server_default=sa.text('true')),
         sa.Column('created_at', sa.DateTime(timezone=True), nullable=True),
         sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
         sa.Column('version', sa.Integer(), nullable=False, server_default=sa.text('1')),
+        sa.CheckConstraint(
+            "skill_type IN ('builtin', 'custom', 'llm', 'http')",
+            name='ck_skills_skill_type',
+        ),
     )
 
     op.create_table(
@@ -89,21 +101,49 @@ def upgrade() -> None:
         sa.Column('id', sa.String(36), primary_key=True),
         sa.Column('tenant_id', sa.String(36), nullable=False, index=True),
         sa.Column('user_id', sa.String(36), nullable=False, index=True),
-        sa.Column('context', sa.JSON(), nullable=True),
+        sa.Column('context', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
         sa.Column('created_at', sa.DateTime(timezone=True), nullable=True),
         sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
     )
+    # "List sessions for user by recency"
+    op.create_index(
+        'ix_chat_sessions_tenant_user_updated',
+        'chat_sessions',
+        ['tenant_id', 'user_id', sa.text('updated_at DESC')],
+    )
 
     op.create_table(
         'chat_messages',
         sa.Column('id', sa.String(36), primary_key=True),
         sa.Column('session_id', sa.String(36), nullable=False, index=True),
         sa.Column('tenant_id', sa.String(36), nullable=False, index=True),
-        sa.Column('role', chat_role_enum, nullable=False),
+        sa.Column('role', sa.String(16), nullable=False),
         sa.Column('content', sa.Text(), nullable=False),
         sa.Column('skill_name', sa.String(128), nullable=True),
-        sa.Column('metadata_json', sa.JSON(), nullable=True),
+        sa.Column('metadata_json', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
         sa.Column('created_at', sa.DateTime(timezone=True), nullable=True),
+        sa.CheckConstraint(
+            "role IN ('user', 'agent', 'skill')",
+            name='ck_chat_messages_role',
+        ),
+    )
+    # "Load messages for session ordered by created_at" → single range scan
+    op.create_index(
+        'ix_chat_messages_session_created',
+        'chat_messages',
+        ['session_id', 'created_at'],
+    )
+    op.create_index(
+        'ix_chat_messages_tenant_created',
+        'chat_messages',
+        ['tenant_id', 'created_at'],
+    )
+    # Makes ``metadata_json @> '{...}'`` containment filters index lookups
+    op.create_index(
+        'ix_chat_messages_metadata_gin',
+        'chat_messages',
+        ['metadata_json'],
+        postgresql_using='gin',
     )
 
     # ── Expand products table ────────────────────────────────────
@@ -115,12 +155,39 @@ def upgrade() -> None:
     op.add_column('products', sa.Column('ncm_codigo', sa.String(8), nullable=True))
     op.add_column('products', sa.Column('cest_codigo', sa.String(7), nullable=True))
     op.add_column('products', sa.Column('cclass_codigo', sa.String(16), nullable=True))
-    op.add_column('products', sa.Column('custom_fields', sa.JSON(), nullable=True))
+    op.add_column('products', sa.Column('custom_fields', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+
+    # Wide TOASTed text: lz4 decompresses ~2-3x faster than the default
+    # pglz (PostgreSQL 14+). Only affects newly written values, no rewrite.
+    bind = op.get_bind()
+    if (
+        bind.dialect.name == 'postgresql'
+        and (bind.dialect.server_version_info or (0,)) >= (14,)
+    ):
+        op.execute("ALTER TABLE chat_messages ALTER COLUMN content SET COMPRESSION lz4")
+        op.execute("ALTER TABLE products ALTER COLUMN descricao_tecnica SET COMPRESSION lz4")
+
+    # EAN is unique per tenant (partial: NULL EANs never collide);
+    # fiscal code columns are join/filter keys against the catalogs.
+    op.create_index(
+        'ix_products_ean',
+        'products',
+        ['tenant_id', 'ean'],
+        unique=True,
+        postgresql_where=sa.text('ean IS NOT NULL'),
+    )
+    op.create_index('ix_products_ncm', 'products', ['ncm_codigo'])
+    op.create_index('ix_products_cest', 'products', ['cest_codigo'])
+    op.create_index('ix_products_cclass', 'products', ['cclass_codigo'])
 
 
 def downgrade() -> None:
     # ── Remove product columns ───────────────────────────────────
 
+    op.drop_index('ix_products_cclass', table_name='products')
+    op.drop_index('ix_products_cest', table_name='products')
+    op.drop_index('ix_products_ncm', table_name='products')
+    op.drop_index('ix_products_ean', table_name='products')
     op.drop_column('products', 'custom_fields')
     op.drop_column('products', 'cclass_codigo')
     op.drop_column('products', 'cest_codigo')
@@ -132,16 +199,18 @@ def downgrade() -> None:
 
     # ── Drop agent tables ────────────────────────────────────────
 
+    op.drop_index('ix_chat_messages_metadata_gin', table_name='chat_messages')
+    op.drop_index('ix_chat_messages_tenant_created', table_name='chat_messages')
+    op.drop_index('ix_chat_messages_session_created', table_name='chat_messages')
     op.drop_table('chat_messages')
+    op.drop_index('ix_chat_sessions_tenant_user_updated', table_name='chat_sessions')
     op.drop_table('chat_sessions')
     op.drop_table('skills')
     op.drop_table('llm_providers')
 
-    sa.Enum(name='chat_role_enum').drop(op.get_bind(), checkfirst=True)
-    sa.Enum(name='skill_type_enum').drop(op.get_bind(), checkfirst=True)
-
     # ── Drop fiscal catalog tables ───────────────────────────────
 
     op.drop_table('classificacoes_tributarias')
+    op.drop_index('ix_cest_ncm_covering', table_name='cest')
     op.drop_table('cest')
     op.drop_table('ncm')
@@ -9,6 +9,7 @@ from typing import Sequence, Union
 
 from alembic import op
 import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
 
 
 # revision identifiers, used by Alembic.
@@ -22,11 +23,15 @@ def upgrade() -> None:
     op.create_table(
         'workflows',
         sa.Column('id', sa.String(36), primary_key=True),
-        sa.Column('tenant_id', sa.String(36), nullable=False, index=True),
+        # No standalone index: uq_workflow_tenant_command leads with tenant_id
+        sa.Column('tenant_id', sa.String(36), nullable=False),
         sa.Column('name', sa.String(255), nullable=False),
         sa.Column('command', sa.String(64), nullable=False, index=True),
         sa.Column('description', sa.Text(), nullable=True),
-        sa.Column('steps', sa.JSON(), nullable=False, server_default='[]'),
+        sa.Column(
+            'steps', postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False, server_default=sa.text("'[]'::jsonb"),
+        ),
         sa.Column(
             'status', sa.String(16),
             nullable=False, server_default='draft',
@@ -45,7 +50,15 @@ def upgrade() -> None:
             'tenant_id', 'command', name='uq_workflow_tenant_command',
         ),
     )
+    # Slash-command lookup only ever targets published workflows
+    op.create_index(
+        'ix_workflows_published',
+        'workflows',
+        ['tenant_id', 'command'],
+        postgresql_where=sa.text("status = 'published'"),
+    )
 
 
 def downgrade() -> None:
+    op.drop_index('ix_workflows_published', table_name='workflows')
     op.drop_table('workflows')
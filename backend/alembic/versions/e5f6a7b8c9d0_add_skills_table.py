@@ -9,6 +9,7 @@ from typing import Sequence, Union
 
 from alembic import op
 import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
 
 
 # revision identifiers, used by Alembic.
@@ -27,7 +28,10 @@ def upgrade() -> None:
         sa.Column('tenant_id', sa.String(36), nullable=False, index=True),
         sa.Column('name', sa.String(64), nullable=False, index=True),
         sa.Column('description', sa.Text(), nullable=False),
-        sa.Column('params_schema', sa.JSON(), nullable=False, server_default='{}'),
+        sa.Column(
+            'params_schema', postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False, server_default=sa.text("'{}'::jsonb"),
+        ),
         sa.Column(
             'category', sa.String(32),
             nullable=False, server_default='general',
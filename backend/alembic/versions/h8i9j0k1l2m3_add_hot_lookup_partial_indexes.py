@@ -0,0 +1,39 @@
+"""Add partial indexes for the per-request LLM provider and page lookups.
+
+Revision ID: h8i9j0k1l2m3
+Revises: g7h8i9j0k1l2
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "h8i9j0k1l2m3"
+down_revision = "g7h8i9j0k1l2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # WHERE tenant_id = ? AND is_active LIMIT 1
+    op.create_index(
+        "ix_llm_providers_active",
+        "llm_providers",
+        ["tenant_id"],
+        postgresql_where=sa.text("is_active"),
+    )
+    # WHERE page_key = ? AND tenant_id = ? AND status = 'published'
+    # ORDER BY version_number DESC LIMIT 1 — served in index order
+    op.create_index(
+        "ix_page_versions_published",
+        "page_versions",
+        ["page_key", "tenant_id", sa.text("version_number DESC")],
+        postgresql_where=sa.text("status = 'published'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_page_versions_published", table_name="page_versions")
+    op.drop_index("ix_llm_providers_active", table_name="llm_providers")
@@ -0,0 +1,32 @@
+"""Add a trigram GIN index for the NCM description search.
+
+Revision ID: i9j0k1l2m3n4
+Revises: h8i9j0k1l2m3
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "i9j0k1l2m3n4"
+down_revision = "h8i9j0k1l2m3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # WHERE descricao ILIKE '%term%' AND ... — unanchored patterns
+    # cannot use a btree, trigrams turn them into an index probe
+    op.create_index(
+        "ix_ncm_descricao_trgm",
+        "ncm",
+        ["descricao"],
+        postgresql_using="gin",
+        postgresql_ops={"descricao": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_ncm_descricao_trgm", table_name="ncm")
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Generator
+import functools
+from typing import Any, Callable, Generator, TypeVar
 
-from fastapi import Depends, HTTPException, Request, status
+from fastapi import Depends, HTTPException, Query, Request, Response, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, make_url
 from sqlalchemy.orm import Session, sessionmaker
 
 from src.application.ports.auth_port import AuthContext
@@ -33,7 +34,6 @@ from src.application.use_cases.account.create_app import CreateAppUseCase
 from src.infrastructure.persistence.database_provisioning import (
     SqlAlchemyDatabaseProvisioner,
 )
-import src.infrastructure.persistence.sqlalchemy.tax_models  # noqa: F401  — register tables
 import src.infrastructure.persistence.sqlalchemy.fiscal_catalog_models  # noqa: F401
 import src.infrastructure.persistence.sqlalchemy.agent_models  # noqa: F401
 import src.infrastructure.persistence.sqlalchemy.account_models  # noqa: F401  — platform mgmt
@@ -53,11 +53,45 @@ from src.infrastructure.security.jwt_auth_adapter import JWTAuthAdapter
 
 # ── Database engine & session ────────────────────────────────────────
 
-engine = create_engine(settings.database_url, pool_pre_ping=True)
+def _driver_connect_args() -> dict[str, Any]:
+    """Driver-specific DBAPI options derived from settings."""
+    if make_url(settings.database_url).get_driver_name() == "psycopg":
+        # Postgres parses/plans hot lookups once per connection
+        return {"prepare_threshold": settings.db_prepare_threshold}
+    return {}
+
+
+engine = create_engine(
+    settings.database_url,
+    connect_args=_driver_connect_args(),
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_pre_ping=False,
+    pool_recycle=settings.db_pool_recycle,
+    pool_use_lifo=True,
+    query_cache_size=settings.db_query_cache_size,
+)
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
 
-# Register automatic tenant filtering on every Session from this factory
-enable_tenant_filter(SessionLocal)
+
+@functools.cache
+def ensure_session_events() -> None:
+    """Register the Session events every SessionLocal session relies on.
+
+    Automatic tenant filtering, and page-schema cache invalidation on
+    ``page_versions`` commits. One-shot and idempotent: called from the
+    app lifespan, and again (for free) by ``get_db`` so sessions are
+    never handed out unwired. Importing this module therefore has no
+    event-wiring side effects.
+    """
+    import src.infrastructure.persistence.sqlalchemy.tax_models  # noqa: F401  — register tables
+    from src.adapters.http.page_schema_events import (
+        enable_page_schema_invalidation,
+    )
+
+    enable_tenant_filter(SessionLocal)
+    enable_page_schema_invalidation(SessionLocal)
+
 
 security_scheme = HTTPBearer(auto_error=False)
 auth_adapter = JWTAuthAdapter()
@@ -69,6 +103,7 @@ def get_db() -> Generator[Session, None, None]:
     Use this for operations that don't need tenant isolation:
     login, seed, admin, schema resolution.
     """
+    ensure_session_events()
     db = SessionLocal()
     try:
         yield db
@@ -76,6 +111,34 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+T = TypeVar("T")
+
+
+def run_in_own_session(fn: Callable[..., T], *args: Any) -> T:
+    """Call ``fn(session, *args)`` on a short-lived session of its own.
+
+    Lets independent lookups run concurrently in worker threads
+    (``asyncio.gather`` over ``run_in_threadpool``) — a Session must
+    never be shared across threads.
+    """
+    with open_session() as session:
+        return fn(session, *args)
+
+
+def open_session(tenant_id: str | None = None) -> Session:
+    """Open a Session owned (and closed) by the caller.
+
+    For work that outlives a request dependency, such as SSE streams.
+    When ``tenant_id`` is given the session is tenant-filtered, like
+    ``get_tenant_db``.
+    """
+    ensure_session_events()
+    db = SessionLocal()
+    if tenant_id:
+        db.info["tenant_id"] = tenant_id
+    return db
+
+
 # ── Auth dependency ──────────────────────────────────────────────────
 
 def _resolve_api_key_context(db: Session) -> AuthContext:
@@ -105,6 +168,62 @@ def _resolve_api_key_context(db: Session) -> AuthContext:
     )
 
 
+# httpOnly cookie carrying the JWT for streaming endpoints, set by the
+# login/signup routes so the token never has to travel in a query string.
+STREAM_AUTH_COOKIE = "otto_auth"
+_STREAM_AUTH_COOKIE_PATH = "/api/otto"
+
+
+def set_stream_cookie(response: Response, token: str) -> None:
+    """Attach the streaming auth cookie for a freshly issued JWT."""
+    response.set_cookie(
+        STREAM_AUTH_COOKIE,
+        token,
+        max_age=settings.jwt_expire_minutes * 60,
+        path=_STREAM_AUTH_COOKIE_PATH,
+        httponly=True,
+        samesite="strict",
+    )
+
+
+def clear_stream_cookie(response: Response) -> None:
+    """Expire the streaming auth cookie (logout)."""
+    response.delete_cookie(
+        STREAM_AUTH_COOKIE,
+        path=_STREAM_AUTH_COOKIE_PATH,
+        httponly=True,
+        samesite="strict",
+    )
+
+
+def get_stream_user(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials | None = Depends(security_scheme),
+    token: str | None = Query(
+        None, description="Deprecated: JWT in the query string"
+    ),
+) -> AuthContext:
+    """Resolve the user of a streaming (SSE) request from its JWT.
+
+    Looks at ``Authorization: Bearer`` first, then the ``otto_auth``
+    cookie, then the legacy ``?token=`` parameter, so an explicit header
+    always wins over a cookie left by an earlier login. Verification
+    results are cached by ``JWTAuthAdapter``, so reconnects are cheap.
+    """
+    raw = (
+        (credentials.credentials if credentials else None)
+        or request.cookies.get(STREAM_AUTH_COOKIE)
+        or token
+    )
+    auth = auth_adapter.verify_token(raw) if raw else None
+    if auth is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired token",
+        )
+    return auth
+
+
 def get_current_user(
     request: Request,
     credentials: HTTPAuthorizationCredentials | None = Depends(security_scheme),
@@ -139,7 +258,7 @@ def get_current_user(
         record = db.execute(
             select(ApiTokenModel).where(
                 ApiTokenModel.token_hash == token_hash,
-                ApiTokenModel.is_active == True,  # noqa: E712
+                ApiTokenModel.is_active.is_(True),
             )
         ).scalar_one_or_none()
         if not record:
@@ -223,32 +342,45 @@ def get_tenant_db(
 
 # ── Page use case factories ──────────────────────────────────────────
 
-def get_page_use_case(db: Session = Depends(get_db)) -> GetPageUseCase:
-    return GetPageUseCase(PageRepositoryImpl(db))
+def get_page_repo(db: Session = Depends(get_db)) -> PageRepositoryImpl:
+    """Single PageRepositoryImpl per request (FastAPI caches the dependency)."""
+    return PageRepositoryImpl(db)
+
+
+def get_page_use_case(
+    repo: PageRepositoryImpl = Depends(get_page_repo),
+) -> GetPageUseCase:
+    return GetPageUseCase(repo)
 
 
-def create_draft_use_case(db: Session = Depends(get_db)) -> CreateDraftUseCase:
-    return CreateDraftUseCase(PageRepositoryImpl(db))
+def create_draft_use_case(
+    repo: PageRepositoryImpl = Depends(get_page_repo),
+) -> CreateDraftUseCase:
+    return CreateDraftUseCase(repo)
 
 
 def publish_page_use_case(
-    db: Session = Depends(get_db),
+    repo: PageRepositoryImpl = Depends(get_page_repo),
 ) -> PublishPageUseCase:
-    return PublishPageUseCase(PageRepositoryImpl(db))
+    return PublishPageUseCase(repo)
 
 
 def rollback_page_use_case(
-    db: Session = Depends(get_db),
+    repo: PageRepositoryImpl = Depends(get_page_repo),
 ) -> RollbackPageUseCase:
-    return RollbackPageUseCase(PageRepositoryImpl(db))
+    return RollbackPageUseCase(repo)
 
 
-def merge_page_use_case(db: Session = Depends(get_db)) -> MergePageUseCase:
-    return MergePageUseCase(PageRepositoryImpl(db))
+def merge_page_use_case(
+    repo: PageRepositoryImpl = Depends(get_page_repo),
+) -> MergePageUseCase:
+    return MergePageUseCase(repo)
 
 
-def get_version_status_use_case(db: Session = Depends(get_db)) -> GetVersionStatusUseCase:
-    return GetVersionStatusUseCase(PageRepositoryImpl(db))
+def get_version_status_use_case(
+    repo: PageRepositoryImpl = Depends(get_page_repo),
+) -> GetVersionStatusUseCase:
+    return GetVersionStatusUseCase(repo)
 
 
 # ── Account use case factories ───────────────────────────────────────
@@ -17,11 +17,13 @@ Register these handlers in the FastAPI app via ``register_error_handlers(app)``.
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 from typing import Any
 
+import orjson
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 
 from src.infrastructure.persistence.sqlalchemy.generic_crud_repository import (
     StaleDataError,
@@ -44,24 +46,46 @@ _HTTP_CODE_MAP: dict[int, str] = {
     500: "INTERNAL_ERROR",
 }
 
+# Dense status → code table: one index instead of a dict hash per error
+_HTTP_CODE_ARR: tuple[str | None, ...] = tuple(
+    _HTTP_CODE_MAP.get(i) for i in range(600)
+)
+
 
 def _error_response(
     status: int,
     code: str,
     message: str,
     details: dict[str, Any] | None = None,
-) -> JSONResponse:
-    """Build a standardized error JSONResponse."""
+) -> Response:
+    """Build a standardized error response (orjson-encoded)."""
+    if not details:
+        return Response(
+            content=_prebuilt_body(status, code, message),
+            status_code=status,
+            media_type="application/json",
+        )
     body: dict[str, Any] = {
         "error": {
             "code": code,
             "message": message,
             "status": status,
+            "details": details,
         }
     }
-    if details:
-        body["error"]["details"] = details
-    return JSONResponse(status_code=status, content=body)
+    return ORJSONResponse(status_code=status, content=body)
+
+
+@lru_cache(maxsize=256)
+def _prebuilt_body(status: int, code: str, message: str) -> bytes:
+    """Serialized body for detail-less errors.
+
+    The same (status, message) pairs repeat constantly — expired tokens,
+    missing entities — so their bytes are rendered once and reused.
+    """
+    return orjson.dumps(
+        {"error": {"code": code, "message": message, "status": status}}
+    )
 
 
 # ── Exception handlers ───────────────────────────────────────────────
@@ -69,26 +93,27 @@ def _error_response(
 
 async def _handle_http_exception(
     request: Request, exc: HTTPException
-) -> JSONResponse:
+) -> Response:
     """Wrap FastAPI's HTTPException in the standard shape."""
     status = exc.status_code
-    code = _HTTP_CODE_MAP.get(status, "ERROR")
+    code = (_HTTP_CODE_ARR[status] if 0 <= status < 600 else None) or "ERROR"
     message = exc.detail if isinstance(exc.detail, str) else str(exc.detail)
     return _error_response(status, code, message)
 
 
 async def _handle_validation_error(
     request: Request, exc: RequestValidationError
-) -> JSONResponse:
+) -> Response:
     """Wrap Pydantic/FastAPI validation errors (422) in the standard shape."""
-    errors = []
-    for err in exc.errors():
-        loc = " → ".join(str(part) for part in err.get("loc", []))
-        errors.append({
-            "field": loc,
+    # Pydantic always sets ``loc``; join with "." (e.g. "body.items.0.name")
+    errors = [
+        {
+            "field": ".".join(map(str, err["loc"])),
             "message": err.get("msg", "Invalid value"),
             "type": err.get("type", "value_error"),
-        })
+        }
+        for err in exc.errors()
+    ]
 
     return _error_response(
         status=422,
@@ -100,7 +125,7 @@ async def _handle_validation_error(
 
 async def _handle_stale_data(
     request: Request, exc: StaleDataError
-) -> JSONResponse:
+) -> Response:
     """Handle optimistic locking conflicts (409)."""
     return _error_response(
         status=409,
@@ -115,7 +140,7 @@ async def _handle_stale_data(
 
 async def _handle_dsl_validation_error(
     request: Request, exc: ValidationError
-) -> JSONResponse:
+) -> Response:
     """Handle DSL field-level validation errors (422)."""
     return _error_response(
         status=422,
@@ -127,7 +152,7 @@ async def _handle_dsl_validation_error(
 
 async def _handle_generic_exception(
     request: Request, exc: Exception
-) -> JSONResponse:
+) -> Response:
     """Catch-all for unhandled exceptions — never leak stack traces."""
     logger.exception("Unhandled exception on %s %s", request.method, request.url.path)
     return _error_response(
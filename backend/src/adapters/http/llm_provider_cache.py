@@ -0,0 +1,206 @@
+"""Process-wide TTL cache for per-tenant agent lookups.
+
+The agent and Otto endpoints resolve the tenant's active LLM provider
+and a published page schema on every request. Both change rarely, so
+results are memoized for a short TTL and dropped explicitly when
+the underlying rows are written (generic CRUD for ``llm_providers``;
+any committed ``page_versions`` change, see ``page_schema_events``).
+
+The TTL bounds staleness across worker processes, which do not share
+invalidations.
+"""
+
+from __future__ import annotations
+
+from threading import Lock
+from typing import Any
+
+from cachetools import TTLCache
+from sqlalchemy import Select, lambda_stmt, select, true
+from sqlalchemy.orm import Session
+
+from src.infrastructure.persistence.sqlalchemy.agent_models import LLMProviderModel
+from src.infrastructure.persistence.sqlalchemy.models import PageVersionModel
+
+_LLM_MAXSIZE = 1024
+_LLM_TTL = 60  # seconds
+# Every page_versions commit invalidates in-process (page_schema_events);
+# the TTL only bounds staleness in the other workers
+_SCHEMA_MAXSIZE = 4096
+_SCHEMA_TTL = 60  # seconds
+
+_llm_cache: TTLCache = TTLCache(maxsize=_LLM_MAXSIZE, ttl=_LLM_TTL)
+_schema_cache: TTLCache = TTLCache(maxsize=_SCHEMA_MAXSIZE, ttl=_SCHEMA_TTL)
+_lock = Lock()
+
+_MISSING = object()
+
+
+def _active_llm(tenant_id: str, *columns: Any) -> Select:
+    """SELECT ``columns`` of the tenant's active provider row."""
+    return (
+        select(*columns)
+        .where(
+            LLMProviderModel.tenant_id == tenant_id,
+            LLMProviderModel.is_active.is_(True),
+        )
+        .limit(1)
+    )
+
+
+def _published_schema(
+    tenant_id: str, page_key: str, scope: str | None,
+) -> Select:
+    """SELECT the latest published ``schema_json`` of a tenant page."""
+    stmt = select(PageVersionModel.schema_json).where(
+        PageVersionModel.page_key == page_key,
+        PageVersionModel.tenant_id == tenant_id,
+        PageVersionModel.status == "published",
+    )
+    if scope is not None:
+        stmt = stmt.where(PageVersionModel.scope == scope)
+    return stmt.order_by(PageVersionModel.version_number.desc()).limit(1)
+
+
+def peek_llm_config(tenant_id: str) -> tuple[str, str] | None:
+    """Return the cached provider config without touching the database.
+
+    Lets async callers skip the threadpool hop and session setup on a hit.
+    """
+    with _lock:
+        return _llm_cache.get(tenant_id)
+
+
+def get_llm_config(db: Session, tenant_id: str) -> tuple[str, str] | None:
+    """Return ``(api_key, model)`` for the tenant's active provider.
+
+    Misses are not cached, so a newly configured provider is picked up
+    on the next request.
+    """
+    with _lock:
+        config = _llm_cache.get(tenant_id)
+    if config is not None:
+        return config
+
+    # lambda_stmt: built and cache-keyed once, tenant_id bound per call
+    stmt = lambda_stmt(
+        lambda: select(LLMProviderModel.api_key_encrypted, LLMProviderModel.model)
+        .where(
+            LLMProviderModel.tenant_id == tenant_id,
+            LLMProviderModel.is_active.is_(True),
+        )
+        .limit(1)
+    )
+    row = db.execute(stmt).first()
+    if row is None:
+        return None
+
+    config = (row.api_key_encrypted, row.model)  # TODO: decrypt in the future
+    with _lock:
+        _llm_cache[tenant_id] = config
+    return config
+
+
+def peek_page_schema(
+    tenant_id: str,
+    page_key: str,
+    scope: str | None = None,
+) -> dict[str, Any] | None:
+    """Return a cached schema without touching the database.
+
+    Raises ``KeyError`` on a miss, since ``None`` is a valid cached value.
+    """
+    with _lock:
+        cached = _schema_cache.get((tenant_id, page_key, scope), _MISSING)
+    if cached is _MISSING:
+        raise KeyError(page_key)
+    return cached
+
+
+def get_page_schema(
+    db: Session,
+    tenant_id: str,
+    page_key: str,
+    scope: str | None = None,
+) -> dict[str, Any] | None:
+    """Return the latest published ``schema_json`` for a tenant page.
+
+    ``scope`` optionally restricts the lookup to ``global``/``tenant``
+    rows. Absent schemas are cached as ``None``.
+    """
+    key = (tenant_id, page_key, scope)
+    with _lock:
+        cached = _schema_cache.get(key, _MISSING)
+    if cached is not _MISSING:
+        return cached
+
+    stmt = lambda_stmt(
+        lambda: select(PageVersionModel.schema_json).where(
+            PageVersionModel.page_key == page_key,
+            PageVersionModel.tenant_id == tenant_id,
+            PageVersionModel.status == "published",
+        )
+    )
+    if scope is not None:
+        stmt += lambda s: s.where(PageVersionModel.scope == scope)
+    stmt += lambda s: s.order_by(PageVersionModel.version_number.desc()).limit(1)
+    schema = db.execute(stmt).scalar_one_or_none()
+    with _lock:
+        _schema_cache[key] = schema
+    return schema
+
+
+def get_llm_config_and_page_schema(
+    db: Session,
+    tenant_id: str,
+    page_key: str,
+    scope: str | None = None,
+) -> tuple[tuple[str, str] | None, dict[str, Any] | None]:
+    """Resolve ``get_llm_config`` and ``get_page_schema`` together.
+
+    When both miss the cache they are fetched in one round-trip: the
+    schema as a one-row scalar subquery, LEFT JOINed to the provider
+    row so ``api_key`` and ``model`` always come from the same row.
+    """
+    with _lock:
+        config = _llm_cache.get(tenant_id)
+        schema = _schema_cache.get((tenant_id, page_key, scope), _MISSING)
+    if config is not None or schema is not _MISSING:
+        if config is None:
+            config = get_llm_config(db, tenant_id)
+        if schema is _MISSING:
+            schema = get_page_schema(db, tenant_id, page_key, scope)
+        return config, schema
+
+    page = select(
+        _published_schema(tenant_id, page_key, scope)
+        .scalar_subquery()
+        .label("schema_json")
+    ).subquery("page")
+    llm = _active_llm(
+        tenant_id, LLMProviderModel.api_key_encrypted, LLMProviderModel.model,
+    ).subquery("llm")
+    api_key, model, schema = db.execute(
+        select(llm.c.api_key_encrypted, llm.c.model, page.c.schema_json)
+        .select_from(page.outerjoin(llm, true()))
+    ).one()
+    # A provider row always has a model: NULL means no active provider
+    config = (api_key, model) if model is not None else None
+    with _lock:
+        if config is not None:
+            _llm_cache[tenant_id] = config
+        _schema_cache[(tenant_id, page_key, scope)] = schema
+    return config, schema
+
+
+def invalidate_llm(tenant_id: str) -> None:
+    """Drop the cached provider config for a tenant."""
+    with _lock:
+        _llm_cache.pop(tenant_id, None)
+
+
+def invalidate_page_schema(page_key: str) -> None:
+    """Drop every cached schema for ``page_key``, across tenants."""
+    with _lock:
+        for key in [k for k in _schema_cache if k[1] == page_key]:
+            _schema_cache.pop(key, None)
@@ -2,28 +2,44 @@
 
 from __future__ import annotations
 
+import importlib
+import logging
 from contextlib import asynccontextmanager, AsyncExitStack
 from typing import AsyncGenerator
 
+import anyio.to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.adapters.http.error_handlers import register_error_handlers
-from src.adapters.http.routers import (
-    account_router,
-    agent_router,
-    auth_router,
-    discovery_router,
-    forge_router,
-    generic_crud_router,
-    llm_router,
-    otto_router,
-    pages_router,
-    settings_router,
-    workflow_router,
-)
 from src.infrastructure.config.settings import settings
 
+logger = logging.getLogger(__name__)
+
+# (module, prefix, tag) — router modules are imported by ``create_app``,
+# so importing this module (Alembic env, tests, tooling) stays cheap.
+_ROUTERS: tuple[tuple[str, str, str], ...] = (
+    ("auth_router", "/auth", "Auth"),
+    ("pages_router", "/pages", "Pages"),
+    # Generic CRUD (covers all DSL-driven entities including fiscal_rules)
+    ("generic_crud_router", "/entities", "Generic CRUD"),
+    # Agent endpoints (product enrichment)
+    ("agent_router", "/agent", "Agent"),
+    # Otto universal chat
+    ("otto_router", "/otto", "Otto"),
+    # Forge — autonomous coding agent
+    ("forge_router", "/forge", "Forge"),
+    # LLM utility endpoints (model listing)
+    ("llm_router", "/llm", "LLM"),
+    ("workflow_router", "/workflows", "Workflows"),
+    # Account / Platform management
+    ("account_router", "/api/accounts", "Accounts"),
+    # User settings (API tokens)
+    ("settings_router", "/settings", "Settings"),
+    # Discovery / introspection endpoints
+    ("discovery_router", "/discovery", "Discovery"),
+)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
@@ -32,6 +48,29 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     Table creation and migrations are handled by Alembic in start.py.
     If MCP is enabled, also runs the session_manager lifespan.
     """
+    from src.adapters.http.dependency_injection import ensure_session_events
+
+    ensure_session_events()
+
+    # Sync endpoints share AnyIO's thread limiter; size it to the DB pool
+    # so DB-bound requests queue on connections, not on threads.
+    anyio.to_thread.current_default_thread_limiter().total_tokens = (
+        settings.threadpool_size
+    )
+
+    # passlib silently falls back to a much slower pure-Python bcrypt
+    # when the C extension is missing; surface that at boot.
+    from src.adapters.http.routers.auth_router import pwd_context
+
+    bcrypt_backend = pwd_context.handler().get_backend()
+    if bcrypt_backend != "bcrypt":
+        logger.warning("bcrypt C backend unavailable, using %r", bcrypt_backend)
+    else:
+        logger.info(
+            "Password hashing: bcrypt backend=%s rounds=%d",
+            bcrypt_backend, settings.bcrypt_rounds,
+        )
+
     mcp_app = getattr(app.state, "mcp_sub_app", None)
     if mcp_app is not None and hasattr(mcp_app, "router"):
         async with AsyncExitStack() as stack:
@@ -39,7 +78,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             yield
     else:
         yield
-    # Shutdown: nothing needed
+
+    # Shutdown: release pooled outbound connections (LLM + skills)
+    from src.application.agent import http_client
+
+    await http_client.aclose()
 
 
 def create_app() -> FastAPI:
@@ -58,75 +101,13 @@ def create_app() -> FastAPI:
     )
 
     # Register routers
-    app.include_router(auth_router.router, prefix="/auth", tags=["Auth"])
-    app.include_router(pages_router.router, prefix="/pages", tags=["Pages"])
-    
-    # Generic CRUD (covers all DSL-driven entities including fiscal_rules)
-    app.include_router(
-        generic_crud_router.router,
-        prefix="/entities",
-        tags=["Generic CRUD"],
-    )
-
-    # Agent endpoints (product enrichment)
-    app.include_router(
-        agent_router.router,
-        prefix="/agent",
-        tags=["Agent"],
-    )
-
-    # Otto universal chat
-    app.include_router(
-        otto_router.router,
-        prefix="/otto",
-        tags=["Otto"],
-    )
-
-    # Forge — autonomous coding agent
-    app.include_router(
-        forge_router.router,
-        prefix="/forge",
-        tags=["Forge"],
-    )
-
-    # LLM utility endpoints (model listing)
-    app.include_router(
-        llm_router.router,
-        prefix="/llm",
-        tags=["LLM"],
-    )
-
-    # Workflows
-    app.include_router(
-        workflow_router.router,
-        prefix="/workflows",
-        tags=["Workflows"],
-    )
-
-    # Account / Platform management
-    app.include_router(
-        account_router.router,
-        prefix="/api/accounts",
-        tags=["Accounts"],
-    )
-
-    # User settings (API tokens)
-    app.include_router(
-        settings_router.router,
-        prefix="/settings",
-        tags=["Settings"],
-    )
+    for module_name, prefix, tag in _ROUTERS:
+        module = importlib.import_module(f"src.adapters.http.routers.{module_name}")
+        app.include_router(module.router, prefix=prefix, tags=[tag])
 
     # Standardized error handling
     register_error_handlers(app)
 
-    # Discovery / introspection endpoints
-    app.include_router(
-        discovery_router.router,
-        prefix="/discovery",
-        tags=["Discovery"],
-    )
-
     # MCP Server — only mounted when ERP_MCP_API_KEY is configured
     if settings.mcp_api_key:
         from src.adapters.mcp.mcp_server import create_mcp_server, build_api_key_middleware
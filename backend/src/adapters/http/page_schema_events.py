@@ -0,0 +1,54 @@
+"""Drop cached page schemas whenever ``page_versions`` rows are committed.
+
+Pages are written from several places: the pages router, the Otto
+skills (``publish_page_version``, ``rollback_page_version``,
+``alter_page_schema``) and the MCP page tools. Rather than each of them
+remembering to invalidate, the session records the ``page_key`` of every
+flushed ``PageVersionModel`` and the caches are cleared once the
+transaction commits. A rollback discards the pending keys.
+"""
+
+from __future__ import annotations
+
+from itertools import chain
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.adapters.http import llm_provider_cache
+from src.adapters.http.routers.generic_crud_router import invalidate_schema
+from src.infrastructure.persistence.sqlalchemy.models import PageVersionModel
+
+_CHANGED_KEYS = "changed_page_keys"
+
+
+def on_page_version_changed(page_key: str) -> None:
+    """Forget every cached schema derived from ``page_key``."""
+    llm_provider_cache.invalidate_page_schema(page_key)
+    invalidate_schema(page_key)
+
+
+def _on_after_flush(session: Session, flush_context: Any) -> None:
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, PageVersionModel):
+            session.info.setdefault(_CHANGED_KEYS, set()).add(obj.page_key)
+
+
+def _on_after_commit(session: Session) -> None:
+    for page_key in session.info.pop(_CHANGED_KEYS, ()):
+        on_page_version_changed(page_key)
+
+
+def _on_after_rollback(session: Session) -> None:
+    session.info.pop(_CHANGED_KEYS, None)
+
+
+def enable_page_schema_invalidation(session_factory: sessionmaker) -> None:
+    """Register the invalidation events on sessions from ``session_factory``.
+
+    Call this ONCE at application startup, after creating the sessionmaker.
+    """
+    event.listen(session_factory, "after_flush", _on_after_flush)
+    event.listen(session_factory, "after_commit", _on_after_commit)
+    event.listen(session_factory, "after_rollback", _on_after_rollback)
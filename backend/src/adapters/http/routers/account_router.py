@@ -6,10 +6,11 @@ Zero business logic — only HTTP translation and dependency injection.
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 
 from src.adapters.http.dependency_injection import (
     get_current_user,
+    set_stream_cookie,
     get_create_app_use_case,
     get_create_project_use_case,
     get_login_use_case,
@@ -44,6 +45,7 @@ router = APIRouter()
 @router.post("/signup", response_model=TokenResponse)
 def signup(
     body: SignupRequest,
+    response: Response,
     use_case: SignupUseCase = Depends(get_signup_use_case),
 ):
     try:
@@ -54,12 +56,14 @@ def signup(
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT, detail=str(exc),
         )
+    set_stream_cookie(response, result["access_token"])
     return TokenResponse(**result)
 
 
 @router.post("/login", response_model=TokenResponse)
 def account_login(
     body: LoginRequest,
+    response: Response,
     use_case: LoginUseCase = Depends(get_login_use_case),
 ):
     try:
@@ -68,6 +72,7 @@ def account_login(
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail=str(exc),
         )
+    set_stream_cookie(response, result["access_token"])
     return TokenResponse(**result)
 
 
@@ -6,23 +6,25 @@ GET  /api/agent/product-enrich/stream → SSE streaming (emits events per step)
 
 from __future__ import annotations
 
-import json
+import asyncio
+from threading import Lock
 from typing import Any
 
+from cachetools import TTLCache
+
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import StreamingResponse
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
-from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from src.adapters.http.dependency_injection import get_current_user, get_tenant_db, get_db, auth_adapter
+from src.adapters.http import llm_provider_cache
+from src.adapters.http.dependency_injection import get_current_user, get_stream_user, get_tenant_db, open_session, run_in_own_session
+from src.adapters.http.sse import EventSourceResponse
 from src.application.agent.llm_provider import GeminiProvider
 from src.application.agent.orchestrator import run_agent, run_agent_stream
 from src.application.agent.prompts.product_enrich import build_system_prompt
 from src.application.agent import skill_registry
 from src.application.ports.auth_port import AuthContext
-from src.infrastructure.persistence.sqlalchemy.agent_models import LLMProviderModel
-from src.infrastructure.persistence.sqlalchemy.models import PageVersionModel
 
 router = APIRouter()
 
@@ -54,17 +56,9 @@ class ProductEnrichResponse(BaseModel):
 
 
 def _get_active_llm(db: Session, tenant_id: str) -> GeminiProvider:
-    """Fetch the active LLM provider config for a tenant and build a GeminiProvider."""
-    stmt = (
-        select(LLMProviderModel)
-        .where(
-            LLMProviderModel.tenant_id == tenant_id,
-            LLMProviderModel.is_active == True,  # noqa: E712
-        )
-        .limit(1)
-    )
-    row = db.execute(stmt).scalar_one_or_none()
-    if row is None:
+    """Build a GeminiProvider from the tenant's active LLM provider config."""
+    config = llm_provider_cache.get_llm_config(db, tenant_id)
+    if config is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=(
@@ -72,10 +66,19 @@ def _get_active_llm(db: Session, tenant_id: str) -> GeminiProvider:
                 "Please add a record to the 'llm_providers' table."
             ),
         )
-    return GeminiProvider(
-        api_key=row.api_key_encrypted,  # TODO: decrypt in the future
-        model=row.model,
-    )
+    api_key, model = config
+    return GeminiProvider(api_key=api_key, model=model)
+
+
+async def _load_active_llm(tenant_id: str) -> GeminiProvider:
+    """Resolve the tenant's provider, opening a session only on a cache miss."""
+    config = llm_provider_cache.peek_llm_config(tenant_id)
+    if config is None:
+        return await run_in_threadpool(
+            run_in_own_session, _get_active_llm, tenant_id,
+        )
+    api_key, model = config
+    return GeminiProvider(api_key=api_key, model=model)
 
 
 def _get_tenant_schema(db: Session, tenant_id: str) -> dict:
@@ -84,21 +87,50 @@ def _get_tenant_schema(db: Session, tenant_id: str) -> dict:
     Looks for a published PageVersion with page_key='product_field_extensions'
     and scope='tenant'. Falls back to an empty dict.
     """
-    stmt = (
-        select(PageVersionModel)
-        .where(
-            PageVersionModel.page_key == "product_field_extensions",
-            PageVersionModel.scope == "tenant",
-            PageVersionModel.tenant_id == tenant_id,
-            PageVersionModel.status == "published",
-        )
-        .order_by(PageVersionModel.version_number.desc())
-        .limit(1)
+    schema = llm_provider_cache.get_page_schema(
+        db, tenant_id, "product_field_extensions", scope="tenant",
     )
-    row = db.execute(stmt).scalar_one_or_none()
-    if row is None:
-        return {}
-    return row.schema_json or {}
+    return schema or {}
+
+
+async def _load_tenant_schema(tenant_id: str) -> dict:
+    """Resolve the tenant schema, opening a session only on a cache miss."""
+    try:
+        schema = llm_provider_cache.peek_page_schema(
+            tenant_id, "product_field_extensions", scope="tenant",
+        )
+    except KeyError:
+        return await run_in_threadpool(
+            run_in_own_session, _get_tenant_schema, tenant_id,
+        )
+    return schema or {}
+
+
+# (tenant_id, skills version) -> (tenant_schema, system_prompt)
+_prompt_cache: TTLCache = TTLCache(maxsize=512, ttl=300)
+_prompt_cache_lock = Lock()
+
+
+def _get_system_prompt(tenant_id: str, tenant_schema: dict) -> str:
+    """Return the product-enrich system prompt, rebuilt only on change.
+
+    A hit also requires the cached schema to equal the current one, so a
+    published schema change is picked up without explicit invalidation.
+    The schema cache hands out the same dict until it changes, so the
+    check is usually an identity test rather than a deep comparison.
+    """
+    key = (tenant_id, skill_registry.version())
+    with _prompt_cache_lock:
+        cached = _prompt_cache.get(key)
+    if cached is not None and (
+        cached[0] is tenant_schema or cached[0] == tenant_schema
+    ):
+        return cached[1]
+
+    system_prompt = build_system_prompt(skill_registry.list_skills(), tenant_schema)
+    with _prompt_cache_lock:
+        _prompt_cache[key] = (tenant_schema, system_prompt)
+    return system_prompt
 
 
 # ── Endpoints ────────────────────────────────────────────────────────
@@ -117,12 +149,14 @@ async def product_enrich(
     """
     tenant_id = auth.tenant_id
 
-    llm = _get_active_llm(db, tenant_id)
-    tenant_schema = _get_tenant_schema(db, tenant_id)
+    # Independent lookups run concurrently; cache hits skip the DB
+    llm, tenant_schema = await asyncio.gather(
+        _load_active_llm(tenant_id),
+        _load_tenant_schema(tenant_id),
+    )
 
     # Build the specialized product enrichment prompt
-    skills = skill_registry.list_skills()
-    system_prompt = build_system_prompt(skills, tenant_schema)
+    system_prompt = _get_system_prompt(tenant_id, tenant_schema)
 
     result = await run_agent(
         user_input=body.user_input,
@@ -145,51 +179,44 @@ async def product_enrich(
 @router.get("/product-enrich/stream")
 async def product_enrich_stream(
     user_input: str = Query(..., description="Natural-language product description or EAN"),
-    # SECURITY TODO: substituir por one-time token com TTL curto —
-    # query param expõe JWT em logs de servidor.
-    token: str = Query(..., description="JWT token (EventSource cannot send headers)"),
-    db: Session = Depends(get_db),
-) -> StreamingResponse:
+    # EventSource cannot send headers: the JWT may still arrive as
+    # ?token= (see get_stream_user). Verified in the threadpool, not
+    # on the event loop.
+    auth: AuthContext = Depends(get_stream_user),
+) -> EventSourceResponse:
     """Enrich product data using the AI agent (SSE streaming mode).
 
     Emits Server-Sent Events for each orchestrator step.
     Each event is ``data: {JSON}\\n\\n``.
     Final event contains ``done: true`` with the product draft.
     """
-    # Manually verify token (EventSource sends it as a query param)
-    auth = auth_adapter.verify_token(token)
-    if auth is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or expired token",
-        )
     tenant_id = auth.tenant_id
-    db.info["tenant_id"] = tenant_id
 
-    llm = _get_active_llm(db, tenant_id)
-    tenant_schema = _get_tenant_schema(db, tenant_id)
+    # Independent lookups run concurrently; cache hits skip the DB
+    llm, tenant_schema = await asyncio.gather(
+        _load_active_llm(tenant_id),
+        _load_tenant_schema(tenant_id),
+    )
 
-    skills = skill_registry.list_skills()
-    system_prompt = build_system_prompt(skills, tenant_schema)
+    system_prompt = _get_system_prompt(tenant_id, tenant_schema)
 
     async def event_generator():
-        async for event in run_agent_stream(
-            user_input=user_input,
-            tenant_id=tenant_id,
-            tenant_schema=tenant_schema,
-            llm=llm,
-            context={"db": db, "tenant_id": tenant_id},
-            system_prompt=system_prompt,
-        ):
-            payload = json.dumps(event, ensure_ascii=False, default=str)
-            yield f"data: {payload}\n\n"
-
-    return StreamingResponse(
-        event_generator(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",
-        },
-    )
+        # The stream owns its session. Its connection goes back to the
+        # pool after every step and is re-acquired lazily by the next
+        # skill query, so long LLM waits do not pin a connection.
+        db = open_session(tenant_id)
+        try:
+            async for event in run_agent_stream(
+                user_input=user_input,
+                tenant_id=tenant_id,
+                tenant_schema=tenant_schema,
+                llm=llm,
+                context={"db": db, "tenant_id": tenant_id},
+                system_prompt=system_prompt,
+            ):
+                db.close()
+                yield event
+        finally:
+            db.close()
+
+    return EventSourceResponse(event_generator(), ping=15)
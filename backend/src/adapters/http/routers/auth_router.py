@@ -2,18 +2,53 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.concurrency import run_in_threadpool
 from passlib.context import CryptContext
 from pydantic import BaseModel
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from src.adapters.http.dependency_injection import auth_adapter, get_db
+from src.adapters.http.dependency_injection import (
+    auth_adapter,
+    clear_stream_cookie,
+    get_db,
+    set_stream_cookie,
+)
+from src.infrastructure.config.settings import settings
 from src.infrastructure.persistence.sqlalchemy.models import UserModel
 
 router = APIRouter()
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=settings.bcrypt_rounds,
+)
+
+# bcrypt is CPU-bound; a dedicated pool keeps login bursts from
+# starving the default threadpool used by sync endpoints.
+_BCRYPT_POOL = ThreadPoolExecutor(
+    max_workers=os.cpu_count(), thread_name_prefix="bcrypt",
+)
+
+
+def _find_user(db: Session, username: str) -> UserModel | None:
+    stmt = select(UserModel).where(UserModel.username == username)
+    return db.execute(stmt).scalar_one_or_none()
+
+
+def _verify_password(password: str, user: UserModel | None) -> bool:
+    if user is None:
+        # Burn the same hash time so unknown usernames are not
+        # distinguishable by response latency.
+        pwd_context.dummy_verify()
+        return False
+    return pwd_context.verify(password, user.password_hash)
 
 
 class LoginRequest(BaseModel):
@@ -30,11 +65,17 @@ class LoginResponse(BaseModel):
 
 
 @router.post("/login", response_model=LoginResponse)
-def login(body: LoginRequest, db: Session = Depends(get_db)) -> LoginResponse:
-    stmt = select(UserModel).where(UserModel.username == body.username)
-    user = db.execute(stmt).scalar_one_or_none()
+async def login(
+    body: LoginRequest,
+    response: Response,
+    db: Session = Depends(get_db),
+) -> LoginResponse:
+    user = await run_in_threadpool(_find_user, db, body.username)
 
-    if not user or not pwd_context.verify(body.password, user.password_hash):
+    verified = await asyncio.get_running_loop().run_in_executor(
+        _BCRYPT_POOL, _verify_password, body.password, user,
+    )
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials",
@@ -46,6 +87,8 @@ def login(body: LoginRequest, db: Session = Depends(get_db)) -> LoginResponse:
         username=user.username,
         role=user.role,
     )
+    # Otto's stream authenticates from this cookie instead of ?token=
+    set_stream_cookie(response, token)
 
     return LoginResponse(
         access_token=token,
@@ -53,3 +96,10 @@ def login(body: LoginRequest, db: Session = Depends(get_db)) -> LoginResponse:
         username=user.username,
         role=user.role,
     )
+
+
+@router.post("/logout")
+def logout() -> Response:
+    response = Response(status_code=status.HTTP_204_NO_CONTENT)
+    clear_stream_cookie(response)
+    return response
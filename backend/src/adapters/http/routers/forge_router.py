@@ -6,16 +6,17 @@ GET  /forge/health   → health check passthrough to forge-worker
 from __future__ import annotations
 
 import asyncio
-import json
 import os
 from typing import AsyncGenerator
 
 import httpx
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import StreamingResponse
+import orjson
+from fastapi import APIRouter, Depends
 from pydantic import BaseModel, Field
 
-from src.adapters.http.dependency_injection import auth_adapter
+from src.adapters.http.dependency_injection import get_stream_user
+from src.adapters.http.sse import EventSourceResponse
+from src.application.ports.auth_port import AuthContext
 
 router = APIRouter()
 
@@ -37,8 +38,8 @@ class ForgeStreamRequest(BaseModel):
 @router.post("/stream")
 async def forge_stream(
     body: ForgeStreamRequest,
-    token: str = Query(..., description="JWT token for auth"),
-) -> StreamingResponse:
+    auth: AuthContext = Depends(get_stream_user),
+) -> EventSourceResponse:
     """Submit a coding task to the Forge agent and stream back the logs via SSE.
 
     Flow:
@@ -47,35 +48,18 @@ async def forge_stream(
     3. Open SSE stream from forge-worker /status/{task_id}
     4. Proxy SSE events back to the browser
     """
-    auth = auth_adapter.verify_token(token)
-    if auth is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or expired token",
-        )
-
-    return StreamingResponse(
-        _forge_sse_generator(body.task, body.branch_prefix),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",
-        },
+    # Agent tasks go quiet for long stretches: keepalive pings stop
+    # proxies from dropping the connection.
+    return EventSourceResponse(
+        _forge_sse_generator(body.task, body.branch_prefix), ping=15,
     )
 
 
 @router.get("/health")
 async def forge_health(
-    token: str = Query(..., description="JWT token for auth"),
+    auth: AuthContext = Depends(get_stream_user),
 ) -> dict:
     """Passthrough health check to forge-worker."""
-    auth = auth_adapter.verify_token(token)
-    if auth is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or expired token",
-        )
     try:
         async with httpx.AsyncClient(timeout=5) as client:
             resp = await client.get(f"{FORGE_WORKER_URL}/health")
@@ -87,8 +71,13 @@ async def forge_health(
 # ── Internal ──────────────────────────────────────────────────────────
 
 
-async def _forge_sse_generator(task: str, branch_prefix: str) -> AsyncGenerator[str, None]:
-    """Submit task to forge-worker and proxy its SSE stream."""
+async def _forge_sse_generator(
+    task: str, branch_prefix: str,
+) -> AsyncGenerator[dict | bytes, None]:
+    """Submit task to forge-worker and proxy its SSE stream.
+
+    Worker payloads are forwarded as raw ``bytes`` (already JSON).
+    """
     try:
         # Step 1: Submit task
         async with httpx.AsyncClient(timeout=30) as client:
@@ -98,11 +87,11 @@ async def _forge_sse_generator(task: str, branch_prefix: str) -> AsyncGenerator[
             )
             if resp.status_code != 200:
                 error = {"type": "error", "message": f"Forge worker error: {resp.text}"}
-                yield f"data: {json.dumps(error)}\n\n"
+                yield error
                 return
-            task_id = resp.json()["task_id"]
+            task_id = orjson.loads(resp.content)["task_id"]
 
-        yield f"data: {json.dumps({'type': 'log', 'message': f'🚀 Tarefa aceita. ID: {task_id}'})}\n\n"
+        yield {"type": "log", "message": f"🚀 Tarefa aceita. ID: {task_id}"}
 
         # Step 2: Stream logs
         async with httpx.AsyncClient(timeout=None) as client:
@@ -111,13 +100,13 @@ async def _forge_sse_generator(task: str, branch_prefix: str) -> AsyncGenerator[
                     if line.startswith("data: "):
                         payload = line[6:]
                         # Forward as-is to browser
-                        yield f"data: {payload}\n\n"
+                        yield payload.encode()
                         # Stop when done or error
                         try:
-                            event = json.loads(payload)
+                            event = orjson.loads(payload)
                             if event.get("type") in ("done", "error"):
                                 break
-                        except json.JSONDecodeError:
+                        except orjson.JSONDecodeError:
                             pass
 
     except httpx.ConnectError:
@@ -125,7 +114,7 @@ async def _forge_sse_generator(task: str, branch_prefix: str) -> AsyncGenerator[
             "type": "error",
             "message": "❌ Forge Worker não está disponível. Verifique se o container está rodando.",
         }
-        yield f"data: {json.dumps(error)}\n\n"
+        yield error
     except Exception as exc:
         error = {"type": "error", "message": f"❌ Erro inesperado: {exc}"}
-        yield f"data: {json.dumps(error)}\n\n"
+        yield error
@@ -16,16 +16,25 @@ via ``db.info["tenant_id"]``.
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from decimal import Decimal, InvalidOperation
-from typing import Any
+from functools import lru_cache
+from threading import Lock
+from typing import Any, NamedTuple
 
+from cachetools import TTLCache
 from fastapi import APIRouter, Body, Depends, HTTPException, Request
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import Numeric, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from src.adapters.http import llm_provider_cache
 from src.adapters.http.dependency_injection import get_tenant_db
 from src.application.dsl_functions.pipeline_runner import (
     run_request_pipeline,
     run_response_pipeline,
+    run_response_pipeline_many,
 )
 from src.application.dsl_functions.query_parser import parse_query_params
 from src.application.dsl_functions.validators import validate_data
@@ -37,32 +46,113 @@ from src.infrastructure.persistence.sqlalchemy.models import (
     PageVersionModel,
 )
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+
+class _FieldMap(NamedTuple):
+    """Per-schema-version field metadata, compiled once."""
+
+    defaults: dict[str, Any]
+    decimal_cols: frozenset[str]
+
+
+class _ResolvedSchema(NamedTuple):
+    schema: dict[str, Any]
+    fields: _FieldMap
+
+
+def _build_field_map(schema: dict[str, Any]) -> _FieldMap:
+    fields = schema.get("dataSource", {}).get("fields", [])
+    return _FieldMap(
+        defaults={
+            f["id"]: f["defaultValue"]
+            for f in fields
+            if f.get("id") and "defaultValue" in f
+        },
+        decimal_cols=frozenset(
+            f["id"] for f in fields if f.get("dbType") == "decimal"
+        ),
+    )
+
+
+_FIELD_MAP_CACHE_SIZE = 256
+_field_maps: OrderedDict[tuple[str, int], _FieldMap] = OrderedDict()
+_field_maps_lock = Lock()
+
+
+def _get_field_map(
+    page_id: str, version_number: int, schema: dict[str, Any]
+) -> _FieldMap:
+    """Return the compiled field map of a published page version.
+
+    Keyed by ``(id, version_number)`` so a publish naturally misses.
+    """
+    key = (page_id, version_number)
+    with _field_maps_lock:
+        fields = _field_maps.get(key)
+    if fields is not None:
+        return fields
+
+    fields = _build_field_map(schema)
+    with _field_maps_lock:
+        _field_maps[key] = fields
+        if len(_field_maps) > _FIELD_MAP_CACHE_SIZE:
+            _field_maps.popitem(last=False)
+    return fields
+
+
+# Global published schemas, keyed by entity name only: ``page_versions``
+# is tenant-exempt. Dropped via ``invalidate_schema`` whenever a
+# page_versions change commits (see ``page_schema_events``).
+_schema_cache: TTLCache = TTLCache(maxsize=512, ttl=30)
+_schema_cache_lock = Lock()
+
+
+def invalidate_schema(entity_name: str) -> None:
+    """Forget the cached published schema for an entity."""
+    with _schema_cache_lock:
+        _schema_cache.pop(entity_name, None)
 
 
 def _resolve_schema(
     db: Session, entity_name: str
-) -> dict[str, Any]:
+) -> _ResolvedSchema:
     """Fetch the published page schema for an entity.
 
     NOTE: ``page_versions`` is in TENANT_EXEMPT_TABLES, so this query
     is NOT filtered by tenant_id even when the session has tenant context.
     """
-    page = (
-        db.query(PageVersionModel)
-        .filter(
+    with _schema_cache_lock:
+        resolved = _schema_cache.get(entity_name)
+    if resolved is not None:
+        return resolved
+
+    # Only the columns used below: no ORM object to hydrate
+    page = db.execute(
+        select(
+            PageVersionModel.id,
+            PageVersionModel.version_number,
+            PageVersionModel.schema_json,
+        )
+        .where(
             PageVersionModel.page_key == entity_name,
             PageVersionModel.scope == "global",
             PageVersionModel.status == "published",
         )
-        .first()
-    )
+        .limit(1)
+    ).first()
     if not page or not page.schema_json:
         raise HTTPException(
             status_code=404,
             detail=f"No published schema for '{entity_name}'",
         )
-    return page.schema_json
+    resolved = _ResolvedSchema(
+        page.schema_json,
+        _get_field_map(page.id, page.version_number, page.schema_json),
+    )
+    with _schema_cache_lock:
+        _schema_cache[entity_name] = resolved
+    return resolved
 
 
 def _get_table_name(schema: dict[str, Any], entity_name: str) -> str:
@@ -77,43 +167,38 @@ def _get_table_name(schema: dict[str, Any], entity_name: str) -> str:
     return table_name
 
 
-def _coerce_field(value: Any, db_type: str) -> Any:
-    """Coerce a request value to the expected DB type."""
-    if value is None or value == "":
+def _to_decimal(value: Any) -> Any:
+    """Coerce a request value for a ``decimal`` column."""
+    if value is None or value == "" or isinstance(value, Decimal):
         return value
-    if db_type == "decimal":
-        try:
-            return Decimal(str(value))
-        except InvalidOperation:
-            return Decimal("0")
-    return value
+    try:
+        return Decimal(str(value))
+    except InvalidOperation:
+        return Decimal("0")
 
 
 def _coerce_data(
-    data: dict[str, Any], schema: dict[str, Any]
+    data: dict[str, Any], fields: _FieldMap
 ) -> dict[str, Any]:
     """Coerce all fields in data dict based on schema field types."""
-    fields = schema.get("dataSource", {}).get("fields", [])
-    type_map = {f["id"]: f.get("dbType", "string") for f in fields}
-
-    coerced = {}
-    for key, value in data.items():
-        db_type = type_map.get(key, "string")
-        coerced[key] = _coerce_field(value, db_type)
-    return coerced
+    decimal_cols = fields.decimal_cols
+    return {
+        key: _to_decimal(value) if key in decimal_cols else value
+        for key, value in data.items()
+    }
 
 
 def _apply_defaults(
-    data: dict[str, Any], schema: dict[str, Any]
+    data: dict[str, Any], fields: _FieldMap
 ) -> dict[str, Any]:
     """Fill missing fields with their declared defaultValue from the schema."""
-    fields = schema.get("dataSource", {}).get("fields", [])
-    result = dict(data)
-    for field in fields:
-        field_id = field.get("id")
-        if field_id and field_id not in result and "defaultValue" in field:
-            result[field_id] = field["defaultValue"]
-    return result
+    return {**fields.defaults, **data}
+
+
+def _invalidate_caches(table_name: str, tenant_id: str) -> None:
+    """Drop agent-side cached config after a write to its source table."""
+    if table_name == "llm_providers":
+        llm_provider_cache.invalidate_llm(tenant_id)
 
 
 def _serialize_row(row: dict[str, Any]) -> dict[str, Any]:
@@ -127,6 +212,39 @@ def _serialize_row(row: dict[str, Any]) -> dict[str, Any]:
     return result
 
 
+@lru_cache(maxsize=None)
+def _numeric_columns(table_name: str) -> frozenset[str]:
+    """Columns of a table whose values come back as ``Decimal``."""
+    table = Base.metadata.tables[table_name]
+    return frozenset(c.name for c in table.c if isinstance(c.type, Numeric))
+
+
+def _serialize_rows(
+    rows: list[dict[str, Any]], table_name: str
+) -> list[dict[str, Any]]:
+    """Batch variant of ``_serialize_row`` driven by the table's column types."""
+    numeric = _numeric_columns(table_name)
+    if not numeric:
+        return rows
+    return [
+        {
+            k: float(v) if k in numeric and v is not None else v
+            for k, v in row.items()
+        }
+        for row in rows
+    ]
+
+
+def _row_response(
+    row: dict[str, Any], schema: dict[str, Any], status_code: int = 200
+) -> ORJSONResponse:
+    """Serialize a single row once with orjson, skipping jsonable_encoder."""
+    return ORJSONResponse(
+        run_response_pipeline(_serialize_row(row), schema),
+        status_code=status_code,
+    )
+
+
 # ── Endpoints ────────────────────────────────────────────────────
 
 
@@ -137,14 +255,14 @@ def list_entities(
     offset: int = 0,
     limit: int = 50,
     db: Session = Depends(get_tenant_db),
-) -> dict[str, Any]:
+) -> ORJSONResponse:
     """List all rows for an entity (auto-filtered by tenant).
 
     Supports declarative filters (``filter[field]=value``) and sort
     (``sort=field`` or ``sort=-field``).  Only fields declared in the
     schema's ``dataSource.filters`` whitelist are allowed.
     """
-    schema = _resolve_schema(db, entity_name)
+    schema, _ = _resolve_schema(db, entity_name)
     table_name = _get_table_name(schema, entity_name)
 
     # Parse & validate filters/sort from query string
@@ -161,11 +279,11 @@ def list_entities(
         sort_field=parsed.sort_field,
         sort_desc=parsed.sort_desc,
     )
-    result["items"] = [
-        run_response_pipeline(_serialize_row(r), schema)
-        for r in result["items"]
-    ]
-    return result
+    result["items"] = run_response_pipeline_many(
+        _serialize_rows(result["items"], table_name), schema,
+    )
+    # Rows are already JSON-native: skip jsonable_encoder
+    return ORJSONResponse(result)
 
 
 @router.get("/{entity_name}/lookup")
@@ -184,7 +302,7 @@ def lookup_entity(
         label_field: Campo a usar como `label` (padrão: 'descricao').
         limit: Máximo de registros a retornar (padrão: 200).
     """
-    schema = _resolve_schema(db, entity_name)
+    schema, _ = _resolve_schema(db, entity_name)
     table_name = _get_table_name(schema, entity_name)
     repo = GenericCrudRepository(db)
     tenant_id = db.info["tenant_id"]
@@ -203,16 +321,35 @@ def get_entity(
     entity_name: str,
     entity_id: str,
     db: Session = Depends(get_tenant_db),
-) -> dict[str, Any]:
+) -> ORJSONResponse:
     """Get a single entity row by ID (auto-filtered by tenant)."""
-    schema = _resolve_schema(db, entity_name)
+    schema, _ = _resolve_schema(db, entity_name)
     table_name = _get_table_name(schema, entity_name)
     repo = GenericCrudRepository(db)
     tenant_id = db.info["tenant_id"]
     result = repo.get_by_id(table_name, tenant_id, entity_id)
     if not result:
         raise HTTPException(status_code=404, detail="Entity not found")
-    return run_response_pipeline(_serialize_row(result), schema)
+    return _row_response(result, schema)
+
+
+_UNIQUE_VIOLATION = "23505"  # PostgreSQL SQLSTATE
+
+
+def _unique_conflict(entity_name: str, exc: IntegrityError) -> Exception:
+    """409 for a write rejected by a unique index (e.g. a duplicate EAN).
+
+    Other integrity errors (NOT NULL, foreign keys) are returned as-is.
+    """
+    orig = exc.orig
+    sqlstate = getattr(orig, "sqlstate", None) or getattr(orig, "pgcode", None)
+    if sqlstate != _UNIQUE_VIOLATION:
+        return exc
+    detail = f"A '{entity_name}' record with the same unique value already exists."
+    constraint = getattr(getattr(orig, "diag", None), "constraint_name", None)
+    if constraint:
+        detail += f" (constraint: {constraint})"
+    return HTTPException(status_code=409, detail=detail)
 
 
 @router.post("/{entity_name}")
@@ -223,19 +360,24 @@ def create_entity(
         description="Campos do novo registro em formato JSON."
     ),
     db: Session = Depends(get_tenant_db),
-) -> dict[str, Any]:
+) -> ORJSONResponse:
     """Create a new row for an entity."""
-    schema = _resolve_schema(db, entity_name)
+    schema, fields = _resolve_schema(db, entity_name)
     table_name = _get_table_name(schema, entity_name)
-    data = _apply_defaults(body, schema)
+    data = _apply_defaults(body, fields)
     validate_data(data, schema, context="create")
-    data = _coerce_data(data, schema)
+    data = _coerce_data(data, fields)
     data = run_request_pipeline(data, schema)
     repo = GenericCrudRepository(db)
     tenant_id = db.info["tenant_id"]
-    result = repo.create(table_name, tenant_id, data)
-    db.commit()
-    return run_response_pipeline(_serialize_row(result), schema)
+    try:
+        result = repo.create(table_name, tenant_id, data)
+        db.commit()
+    except IntegrityError as exc:
+        db.rollback()
+        raise _unique_conflict(entity_name, exc)
+    _invalidate_caches(table_name, tenant_id)
+    return _row_response(result, schema)
 
 
 @router.put("/{entity_name}/{entity_id}")
@@ -247,14 +389,14 @@ def update_entity(
         description="Campos a atualizar em formato JSON. Suporta optimistic locking via _version."
     ),
     db: Session = Depends(get_tenant_db),
-) -> dict[str, Any]:
+) -> ORJSONResponse:
     """Update an existing entity row (auto-filtered by tenant).
 
     Supports optimistic locking: if the body contains ``_version``,
     the update will only succeed if the current row version matches.
     On conflict returns 409.
     """
-    schema = _resolve_schema(db, entity_name)
+    schema, fields = _resolve_schema(db, entity_name)
     table_name = _get_table_name(schema, entity_name)
 
     # Extract version hint before coercion (not a DB field)
@@ -270,21 +412,25 @@ def update_entity(
 
     validate_data(body, schema, context="update")
 
-    data = _coerce_data(body, schema)
+    data = _coerce_data(body, fields)
     data = run_request_pipeline(data, schema)
     repo = GenericCrudRepository(db)
     tenant_id = db.info["tenant_id"]
 
     # StaleDataError propagates to the global handler → 409 with details
-    result = repo.update(
-        table_name, tenant_id, entity_id, data,
-        expected_version=expected_version,
-    )
-
-    if not result:
-        raise HTTPException(status_code=404, detail="Entity not found")
-    db.commit()
-    return run_response_pipeline(_serialize_row(result), schema)
+    try:
+        result = repo.update(
+            table_name, tenant_id, entity_id, data,
+            expected_version=expected_version,
+        )
+        if not result:
+            raise HTTPException(status_code=404, detail="Entity not found")
+        db.commit()
+    except IntegrityError as exc:
+        db.rollback()
+        raise _unique_conflict(entity_name, exc)
+    _invalidate_caches(table_name, tenant_id)
+    return _row_response(result, schema)
 
 
 @router.delete("/{entity_name}/{entity_id}")
@@ -294,7 +440,7 @@ def delete_entity(
     db: Session = Depends(get_tenant_db),
 ) -> dict[str, str]:
     """Delete an entity row (auto-filtered by tenant)."""
-    schema = _resolve_schema(db, entity_name)
+    schema, _ = _resolve_schema(db, entity_name)
     table_name = _get_table_name(schema, entity_name)
     repo = GenericCrudRepository(db)
     tenant_id = db.info["tenant_id"]
@@ -302,4 +448,5 @@ def delete_entity(
     if not deleted:
         raise HTTPException(status_code=404, detail="Entity not found")
     db.commit()
+    _invalidate_caches(table_name, tenant_id)
     return {"detail": f"{entity_name} deleted"}
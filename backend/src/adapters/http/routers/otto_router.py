@@ -7,25 +7,27 @@ GET  /otto/components → list of available UI components and skills
 
 from __future__ import annotations
 
-import json
+import hashlib
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import StreamingResponse
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response
 from pydantic import BaseModel, Field
-from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from src.adapters.http.dependency_injection import get_db, auth_adapter
+from src.adapters.http import llm_provider_cache
+from src.adapters.http.dependency_injection import get_stream_user, open_session, run_in_own_session
+from src.adapters.http.sse import EventSourceResponse
 from src.application.agent.llm_provider import GeminiProvider
 from src.application.otto.orchestrator import run_otto_stream
+from src.application.ports.auth_port import AuthContext
 from src.application.otto.sessions import (
     create_session,
     get_session,
     remove_session,
 )
-from src.infrastructure.persistence.sqlalchemy.agent_models import LLMProviderModel
-from src.infrastructure.persistence.sqlalchemy.models import PageVersionModel
 
 router = APIRouter()
 
@@ -53,17 +55,9 @@ class OttoStreamRequest(BaseModel):
 
 
 def _get_active_llm(db: Session, tenant_id: str) -> GeminiProvider:
-    """Fetch the active LLM provider config for a tenant."""
-    stmt = (
-        select(LLMProviderModel)
-        .where(
-            LLMProviderModel.tenant_id == tenant_id,
-            LLMProviderModel.is_active == True,  # noqa: E712
-        )
-        .limit(1)
-    )
-    row = db.execute(stmt).scalar_one_or_none()
-    if row is None:
+    """Build a GeminiProvider from the tenant's active LLM provider config."""
+    config = llm_provider_cache.get_llm_config(db, tenant_id)
+    if config is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=(
@@ -71,28 +65,49 @@ def _get_active_llm(db: Session, tenant_id: str) -> GeminiProvider:
                 "Please add a record to the 'llm_providers' table."
             ),
         )
-    return GeminiProvider(
-        api_key=row.api_key_encrypted,
-        model=row.model,
-    )
+    api_key, model = config
+    return GeminiProvider(api_key=api_key, model=model)
 
 
-def _get_page_schema(db: Session, tenant_id: str, page_key: str) -> dict | None:
-    """Fetch the page schema for context injection."""
-    stmt = (
-        select(PageVersionModel)
-        .where(
-            PageVersionModel.page_key == page_key,
-            PageVersionModel.tenant_id == tenant_id,
-            PageVersionModel.status == "published",
+async def _load_active_llm(tenant_id: str) -> GeminiProvider:
+    """Resolve the tenant's provider, opening a session only on a cache miss."""
+    config = llm_provider_cache.peek_llm_config(tenant_id)
+    if config is None:
+        return await run_in_threadpool(
+            run_in_own_session, _get_active_llm, tenant_id,
         )
-        .order_by(PageVersionModel.version_number.desc())
-        .limit(1)
+    api_key, model = config
+    return GeminiProvider(api_key=api_key, model=model)
+
+
+def _get_llm_and_page_schema(
+    db: Session, tenant_id: str, page_key: str,
+) -> tuple[GeminiProvider, dict | None]:
+    """Fetch the provider config and the page schema in one round-trip."""
+    config, page_schema = llm_provider_cache.get_llm_config_and_page_schema(
+        db, tenant_id, page_key,
     )
-    row = db.execute(stmt).scalar_one_or_none()
-    if row is None:
-        return None
-    return row.schema_json
+    if config is None:
+        return _get_active_llm(db, tenant_id), page_schema
+    api_key, model = config
+    return GeminiProvider(api_key=api_key, model=model), page_schema
+
+
+async def _load_llm_and_page_schema(
+    tenant_id: str, page_key: str,
+) -> tuple[GeminiProvider, dict | None]:
+    """Resolve both lookups, opening a session only on a cache miss."""
+    config = llm_provider_cache.peek_llm_config(tenant_id)
+    try:
+        page_schema = llm_provider_cache.peek_page_schema(tenant_id, page_key)
+    except KeyError:
+        config = None
+    if config is None:
+        return await run_in_threadpool(
+            run_in_own_session, _get_llm_and_page_schema, tenant_id, page_key,
+        )
+    api_key, model = config
+    return GeminiProvider(api_key=api_key, model=model), page_schema
 
 
 # ── Endpoint ─────────────────────────────────────────────────────────
@@ -101,9 +116,8 @@ def _get_page_schema(db: Session, tenant_id: str, page_key: str) -> dict | None:
 @router.post("/stream")
 async def otto_stream(
     body: OttoStreamRequest,
-    token: str = Query(..., description="JWT token for auth"),
-    db: Session = Depends(get_db),
-) -> StreamingResponse:
+    auth: AuthContext = Depends(get_stream_user),
+) -> EventSourceResponse:
     """Otto universal chat — SSE streaming endpoint.
 
     Accepts POST with JSON body containing:
@@ -113,20 +127,16 @@ async def otto_stream(
 
     Emits Server-Sent Events for each orchestrator step.
     """
-    auth = auth_adapter.verify_token(token)
-    if auth is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or expired token",
-        )
     tenant_id = auth.tenant_id
-    db.info["tenant_id"] = tenant_id
-
-    llm = _get_active_llm(db, tenant_id)
 
-    page_schema = None
+    # Cache hits skip the DB; misses share a single round-trip
     if body.page_key:
-        page_schema = _get_page_schema(db, tenant_id, body.page_key)
+        llm, page_schema = await _load_llm_and_page_schema(
+            tenant_id, body.page_key,
+        )
+    else:
+        llm = await _load_active_llm(tenant_id)
+        page_schema = None
 
     # Convert history to list of dicts for the orchestrator
     history = [{"role": m.role, "content": m.content} for m in body.history]
@@ -135,6 +145,9 @@ async def otto_stream(
     session = create_session()
 
     async def event_generator():
+        # The stream owns its DB session and releases the connection
+        # after every event; see agent_router.product_enrich_stream.
+        db = open_session(tenant_id)
         try:
             async for event in run_otto_stream(
                 user_input=body.input,
@@ -146,20 +159,13 @@ async def otto_stream(
                 history=history,
                 session=session,
             ):
-                payload = json.dumps(event, ensure_ascii=False, default=str)
-                yield f"data: {payload}\n\n"
+                db.close()
+                yield event
         finally:
+            db.close()
             remove_session(session.id)
 
-    return StreamingResponse(
-        event_generator(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",
-        },
-    )
+    return EventSourceResponse(event_generator(), ping=15)
 
 
 # ── Interactive response endpoint ────────────────────────────────────
@@ -200,27 +206,40 @@ FRONTEND_COMPONENTS = [
 ]
 
 
+# (skills version, JSON body, ETag) — rebuilt only when skills change
+_components_payload: tuple[int, bytes, str] | None = None
+
+
+def _get_components_payload() -> tuple[bytes, str]:
+    global _components_payload
+    from src.application.agent import skill_registry
+
+    version = skill_registry.version()
+    cached = _components_payload
+    if cached is None or cached[0] != version:
+        skills = skill_registry.list_skills()
+        body = orjson.dumps({
+            "components": FRONTEND_COMPONENTS,
+            "skills": [{"name": s["name"], "description": s.get("description", "")} for s in skills],
+        })
+        etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+        cached = _components_payload = (version, body, etag)
+    return cached[1], cached[2]
+
+
 @router.get("/components")
 async def list_components(
-    token: str = Query(..., description="JWT token for auth"),
-    db: Session = Depends(get_db),
-) -> dict:
+    request: Request,
+    auth: AuthContext = Depends(get_stream_user),
+) -> Response:
     """Return available UI components and skills.
 
     The LLM uses this list to decide when it can render a component
-    inline in the chat vs. responding with plain text.
+    inline in the chat vs. responding with plain text. The body is
+    pre-encoded and carries an ETag, so clients can revalidate (304).
     """
-    auth = auth_adapter.verify_token(token)
-    if auth is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or expired token",
-        )
-
-    from src.application.agent import skill_registry
-    skills = skill_registry.list_skills()
-
-    return {
-        "components": FRONTEND_COMPONENTS,
-        "skills": [{"name": s["name"], "description": s.get("description", "")} for s in skills],
-    }
+    body, etag = _get_components_payload()
+    headers = {"ETag": etag}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
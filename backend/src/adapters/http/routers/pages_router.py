@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import Any, Optional
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from src.adapters.http.dependency_injection import (
@@ -26,7 +27,7 @@ from src.application.use_cases.merge_page import MergePageUseCase
 from src.application.use_cases.publish_page import PublishPageUseCase
 from src.application.use_cases.rollback_page import RollbackPageUseCase
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 class DraftRequest(BaseModel):
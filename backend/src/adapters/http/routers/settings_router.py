@@ -62,7 +62,7 @@ def list_tokens(
     tokens = db.execute(
         select(ApiTokenModel).where(
             ApiTokenModel.user_id == auth.user_id,
-            ApiTokenModel.is_active == True,  # noqa: E712
+            ApiTokenModel.is_active.is_(True),
         ).order_by(ApiTokenModel.created_at.desc())
     ).scalars().all()
     return [
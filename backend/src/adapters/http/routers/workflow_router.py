@@ -9,20 +9,21 @@ POST /workflows/{id}/execute  → SSE streaming execution
 
 from __future__ import annotations
 
-import json
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import StreamingResponse
-from pydantic import BaseModel, Field
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import BaseModel, ConfigDict, Field
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from src.adapters.http.dependency_injection import (
     get_db,
+    get_stream_user,
     get_tenant_db,
-    auth_adapter,
 )
+from src.adapters.http.sse import EventSourceResponse
 from src.application.ports.auth_port import AuthContext
 from src.application.workflows.executor import execute_workflow
 from src.application.workflows.workflow_use_cases import (
@@ -31,12 +32,12 @@ from src.application.workflows.workflow_use_cases import (
     ListWorkflowsUseCase,
     UpdateWorkflowUseCase,
 )
-from src.domain.entities.workflow import Workflow
+from src.domain.entities.workflow import WorkflowStatus
 from src.infrastructure.persistence.sqlalchemy.workflow_repository_impl import (
     SqlAlchemyWorkflowRepository,
 )
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 # ── Request / Response models ────────────────────────────────────
@@ -65,50 +66,70 @@ class WorkflowUpdateIn(BaseModel):
     status: str | None = None
 
 
-def _serialize(w: Workflow) -> dict:
-    return {
-        "id": w.id,
-        "tenant_id": w.tenant_id,
-        "name": w.name,
-        "command": w.command,
-        "description": w.description,
-        "steps": [
-            {
-                "skill": s.skill,
-                "params": s.params,
-                "requires_confirmation": s.requires_confirmation,
-                "on_error": s.on_error,
-            }
-            for s in w.steps
-        ],
-        "status": w.status.value,
-        "version": w.version,
-    }
+class WorkflowStepOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    skill: str
+    params: dict[str, Any]
+    requires_confirmation: bool
+    on_error: str
+
+
+class WorkflowOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: str
+    tenant_id: str
+    name: str
+    command: str
+    description: str
+    steps: list[WorkflowStepOut]
+    status: WorkflowStatus
+    version: int
+
+
+class WorkflowListOut(BaseModel):
+    items: list[WorkflowOut]
+    total: int
+
+
+def _json_response(model: BaseModel, status_code: int = 200) -> Response:
+    """Serialize a response model in pydantic-core and return it as-is.
+
+    Returning the entity to FastAPI instead would run it through
+    ``dataclasses.asdict`` and ``jsonable_encoder`` first.
+    """
+    return Response(
+        content=model.model_dump_json(),
+        media_type="application/json",
+        status_code=status_code,
+    )
 
 
 # ── CRUD endpoints ──────────────────────────────────────────────
 
 
-@router.get("")
+@router.get("", response_model=WorkflowListOut)
 def list_workflows(
     db: Session = Depends(get_tenant_db),
-) -> dict:
+) -> Response:
     """List all workflows for the current tenant."""
     tenant_id = db.info["tenant_id"]
     repo = SqlAlchemyWorkflowRepository(db)
     uc = ListWorkflowsUseCase(repo)
     items = uc.execute(tenant_id)
-    return {
-        "items": [_serialize(w) for w in items],
-        "total": len(items),
-    }
+    return _json_response(
+        WorkflowListOut.model_validate(
+            {"items": items, "total": len(items)}, from_attributes=True,
+        )
+    )
 
 
-@router.get("/{workflow_id}")
+@router.get("/{workflow_id}", response_model=WorkflowOut)
 def get_workflow(
     workflow_id: str,
     db: Session = Depends(get_tenant_db),
-) -> dict:
+) -> Response:
     """Get a single workflow by ID."""
     tenant_id = db.info["tenant_id"]
     repo = SqlAlchemyWorkflowRepository(db)
@@ -119,14 +140,16 @@ def get_workflow(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Workflow not found.",
         )
-    return _serialize(w)
+    return _json_response(WorkflowOut.model_validate(w))
 
 
-@router.post("", status_code=status.HTTP_201_CREATED)
+@router.post(
+    "", status_code=status.HTTP_201_CREATED, response_model=WorkflowOut,
+)
 def create_workflow(
     body: WorkflowCreateIn,
     db: Session = Depends(get_tenant_db),
-) -> dict:
+) -> Response:
     """Create a new workflow."""
     tenant_id = db.info["tenant_id"]
     repo = SqlAlchemyWorkflowRepository(db)
@@ -143,22 +166,23 @@ def create_workflow(
                 f"already exists for this tenant."
             ),
         )
-    return _serialize(w)
+    return _json_response(
+        WorkflowOut.model_validate(w), status_code=status.HTTP_201_CREATED,
+    )
 
 
-@router.put("/{workflow_id}")
+@router.put("/{workflow_id}", response_model=WorkflowOut)
 def update_workflow(
     workflow_id: str,
     body: WorkflowUpdateIn,
     db: Session = Depends(get_tenant_db),
-) -> dict:
+) -> Response:
     """Update an existing workflow."""
     tenant_id = db.info["tenant_id"]
     repo = SqlAlchemyWorkflowRepository(db)
     uc = UpdateWorkflowUseCase(repo)
+    # model_dump recurses into steps; params keep their None values
     data = body.model_dump(exclude_none=True)
-    if "steps" in data:
-        data["steps"] = [s.model_dump() for s in body.steps]  # type: ignore
     try:
         w = uc.execute(workflow_id, data, tenant_id)
         db.commit()
@@ -173,7 +197,7 @@ def update_workflow(
             status_code=status.HTTP_409_CONFLICT,
             detail="Duplicate command for this tenant.",
         )
-    return _serialize(w)
+    return _json_response(WorkflowOut.model_validate(w))
 
 
 # ── Execution endpoint (SSE) ────────────────────────────────────
@@ -183,25 +207,20 @@ def update_workflow(
 async def execute_workflow_endpoint(
     workflow_id: str,
     sandbox: bool = Query(False),
-    token: str = Query(..., description="JWT token for auth"),
+    auth: AuthContext = Depends(get_stream_user),
     db: Session = Depends(get_db),
-) -> StreamingResponse:
+) -> EventSourceResponse:
     """Execute a workflow via SSE streaming.
 
-    Uses query-param auth (same pattern as Otto) because SSE
-    via fetch doesn't support Authorization headers consistently.
+    Uses the streaming auth dependency (same as Otto): the JWT may
+    arrive as ``?token=`` because SSE via fetch doesn't support
+    Authorization headers consistently.
     """
-    auth = auth_adapter.verify_token(token)
-    if auth is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or expired token",
-        )
     tenant_id = auth.tenant_id
     db.info["tenant_id"] = tenant_id
 
     repo = SqlAlchemyWorkflowRepository(db)
-    w = repo.get_by_id(workflow_id, tenant_id)
+    w = await run_in_threadpool(repo.get_by_id, workflow_id, tenant_id)
     if w is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -210,17 +229,6 @@ async def execute_workflow_endpoint(
 
     context = {"db": db, "tenant_id": tenant_id}
 
-    async def event_generator():
-        async for event in execute_workflow(w, context, sandbox=sandbox):
-            payload = json.dumps(event, ensure_ascii=False, default=str)
-            yield f"data: {payload}\n\n"
-
-    return StreamingResponse(
-        event_generator(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",
-        },
+    return EventSourceResponse(
+        execute_workflow(w, context, sandbox=sandbox), ping=15,
     )
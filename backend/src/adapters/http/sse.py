@@ -0,0 +1,102 @@
+"""Server-Sent Events response shared by the streaming endpoints.
+
+FastAPI 0.115 (pinned) has no native ``EventSourceResponse``, so this is
+a thin ``StreamingResponse`` subclass with the same contract: endpoints
+yield plain event objects, framing into ``data: {JSON}\\n\\n`` happens
+here, the anti-buffering headers are always set, and a ``: ping``
+comment is emitted whenever the producer stays idle for ``ping``
+seconds so proxies do not drop long-running streams.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from decimal import Decimal
+from types import MappingProxyType
+from typing import Any, AsyncIterable, AsyncIterator
+
+import orjson
+from fastapi.responses import StreamingResponse
+
+_PING_FRAME = b": ping\n\n"
+_SSE_PREFIX = b"data: "
+_SSE_SUFFIX = b"\n\n"
+
+# The SSE header contract, shared (read-only) by every stream
+_SSE_HEADERS = MappingProxyType({
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",
+})
+
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+
+def _default(obj: Any) -> Any:
+    """Encode the few non-native types skill results carry.
+
+    datetimes, UUIDs and dataclasses are handled by orjson itself;
+    anything else is a bug in the emitter and fails loudly.
+    """
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _frame(event: Any) -> bytes:
+    """Encode a single event as an SSE ``data:`` frame.
+
+    ``bytes`` events are taken as already-encoded JSON (proxied streams).
+    """
+    if not isinstance(event, bytes):
+        event = orjson.dumps(event, default=_default, option=_ORJSON_OPTIONS)
+    # One join: a single copy of the payload, however large
+    return b"".join((_SSE_PREFIX, event, _SSE_SUFFIX))
+
+
+async def _stream(
+    events: AsyncIterable[Any], ping: float | None
+) -> AsyncIterator[bytes]:
+    iterator = events.__aiter__()
+    next_event = asyncio.ensure_future(iterator.__anext__())
+    try:
+        while True:
+            done, _ = await asyncio.wait({next_event}, timeout=ping)
+            if not done:
+                yield _PING_FRAME
+                continue
+            try:
+                event = next_event.result()
+            except StopAsyncIteration:
+                return
+            yield _frame(event)
+            # One loop trip so the server writes this frame out before
+            # the producer's next step, instead of batching bursts.
+            await asyncio.sleep(0)
+            next_event = asyncio.ensure_future(iterator.__anext__())
+    finally:
+        # Client went away (or the stream ended): unwind the producer
+        # so its own ``finally`` blocks run.
+        if not next_event.done():
+            next_event.cancel()
+        elif hasattr(iterator, "aclose"):
+            await iterator.aclose()
+
+
+class EventSourceResponse(StreamingResponse):
+    """Stream JSON-serializable events as ``text/event-stream``."""
+
+    def __init__(
+        self,
+        events: AsyncIterable[Any],
+        ping: float | None = 15,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        super().__init__(
+            _stream(events, ping),
+            media_type="text/event-stream",
+            headers={**_SSE_HEADERS, **headers} if headers else _SSE_HEADERS,
+        )
@@ -124,7 +124,7 @@ def build_api_key_middleware(app: FastAPI) -> None:
                     record = db.execute(
                         select(ApiTokenModel).where(
                             ApiTokenModel.token_hash == token_hash,
-                            ApiTokenModel.is_active == True,  # noqa: E712
+                            ApiTokenModel.is_active.is_(True),
                         )
                     ).scalar_one_or_none()
                     if record:
@@ -0,0 +1,48 @@
+"""Shared outbound HTTP client for the agent.
+
+LLM calls and network-bound skills (Open Food Facts, DuckDuckGo) go
+through one pooled HTTP/2 ``httpx.AsyncClient`` so repeated calls reuse
+warm TLS connections instead of paying DNS + handshake every time.
+Timeouts and redirect policy are passed per request by each caller;
+the client defaults only bound connection setup. Idle connections are
+kept for 90s, long enough to survive the gap between two ReAct turns.
+
+The client is bound to the event loop that created it and rebuilt if a
+different loop asks for it (tests, ``asyncio.run`` in scripts).
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+
+_client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared client for the running event loop."""
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    client = _client
+    if client is None or client.is_closed or _client_loop is not loop:
+        client = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(60.0, connect=10.0),
+            limits=httpx.Limits(
+                max_connections=128,
+                max_keepalive_connections=64,
+                keepalive_expiry=90.0,
+            ),
+        )
+        _client, _client_loop = client, loop
+    return client
+
+
+async def aclose() -> None:
+    """Close the shared client (application shutdown)."""
+    global _client, _client_loop
+    client, _client, _client_loop = _client, None, None
+    if client is not None:
+        await client.aclose()
@@ -6,14 +6,26 @@ raw text response. JSON parsing is the caller's responsibility.
 
 from __future__ import annotations
 
+import asyncio
+import logging
 from abc import ABC, abstractmethod
+from typing import AsyncIterator
 
 import httpx
+import orjson
+
+from src.application.agent import http_client
+
+logger = logging.getLogger(__name__)
 
 
 class LLMProvider(ABC):
     """Abstract base for LLM providers."""
 
+    # Whether the agent loop may answer an identical message list from
+    # ``response_cache`` instead of calling the provider again.
+    cache_enabled: bool = True
+
     @abstractmethod
     async def complete(self, messages: list[dict]) -> str:
         """Send messages to the LLM and return the raw text response.
@@ -26,6 +38,13 @@ class LLMProvider(ABC):
             Raw text string from the model.
         """
 
+    async def stream(self, messages: list[dict]) -> AsyncIterator[str]:
+        """Yield the raw text response in chunks as the model produces it.
+
+        Providers without a streaming API yield ``complete()`` whole.
+        """
+        yield await self.complete(messages)
+
 
 class GeminiProvider(LLMProvider):
     """Google Gemini provider via REST API (httpx).
@@ -35,79 +54,68 @@ class GeminiProvider(LLMProvider):
     """
 
     _BASE_URL = "https://generativelanguage.googleapis.com/v1beta"
-    _TIMEOUT = 60  # seconds
+    _TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+    # Rate limiting / overload: retried with backoff before giving up
+    _RETRY_STATUSES = frozenset({429, 503})
+    _MAX_ATTEMPTS = 3
+    _MAX_RETRY_DELAY = 10.0  # seconds
 
     def __init__(self, api_key: str, model: str = "gemini-2.5-flash") -> None:
         self.api_key = api_key
         self.model = model
 
-    def _build_contents(self, messages: list[dict]) -> list[dict]:
-        """Convert our message format to Gemini's ``contents`` format.
+    # Our role -> Gemini role; anything else is sent as "user"
+    _ROLE_MAP = {"model": "model", "assistant": "model"}
 
-        Maps:
-            role "user"    -> Gemini role "user"
-            role "model"   -> Gemini role "model"
-            role "system"  -> extracted as system instruction
+    def _build_request(
+        self, messages: list[dict],
+    ) -> tuple[list[dict], str | None]:
+        """Convert our message format to Gemini's in a single pass.
+
+        Returns ``(contents, system_instruction)``:
+            role "user"      -> Gemini role "user"
+            role "model"     -> Gemini role "model"
+            role "assistant" -> Gemini role "model"
+            role "system"    -> first one becomes the system instruction
         """
         contents: list[dict] = []
+        append = contents.append
+        role_map = self._ROLE_MAP
+        system_instruction: str | None = None
+        has_system = False
         for msg in messages:
             role = msg.get("role", "user")
-            content = msg.get("content", "")
             if role == "system":
-                # System messages handled separately
+                if not has_system:
+                    system_instruction = msg.get("content")
+                    has_system = True
                 continue
-            gemini_role = "model" if role in ("model", "assistant") else "user"
-            contents.append({
-                "role": gemini_role,
-                "parts": [{"text": content}],
+            append({
+                "role": role_map.get(role, "user"),
+                "parts": [{"text": msg.get("content", "")}],
             })
-        return contents
-
-    def _extract_system_instruction(self, messages: list[dict]) -> str | None:
-        """Extract system instruction from messages if present."""
-        for msg in messages:
-            if msg.get("role") == "system":
-                return msg.get("content")
-        return None
-
-    async def complete(self, messages: list[dict]) -> str:
-        """Call Gemini generateContent and return the raw text."""
-        url = (
-            f"{self._BASE_URL}/models/{self.model}:generateContent"
-        )
+        return contents, system_instruction
 
+    def _build_body(self, messages: list[dict]) -> dict:
+        """Build the ``generateContent`` request body."""
+        contents, system_instruction = self._build_request(messages)
         body: dict = {
-            "contents": self._build_contents(messages),
+            "contents": contents,
             "generationConfig": {
                 "temperature": 0.2,
                 "maxOutputTokens": 2048,
             },
         }
 
-        system_instruction = self._extract_system_instruction(messages)
         if system_instruction:
             body["systemInstruction"] = {
                 "parts": [{"text": system_instruction}],
             }
+        return body
 
-        async with httpx.AsyncClient(timeout=self._TIMEOUT) as client:
-            resp = await client.post(
-                url,
-                json=body,
-                params={"key": self.api_key},
-            )
-            if resp.status_code >= 400:
-                import logging
-                logger = logging.getLogger(__name__)
-                logger.error(
-                    "Gemini API error %s: %s",
-                    resp.status_code,
-                    resp.text[:500],
-                )
-            resp.raise_for_status()
-            data = resp.json()
-
-        # Extract text from the first candidate
+    @staticmethod
+    def _candidate_text(data: dict) -> str:
+        """Text of the first part of the first candidate, or ``""``."""
         candidates = data.get("candidates", [])
         if not candidates:
             return ""
@@ -117,3 +125,85 @@ class GeminiProvider(LLMProvider):
             return ""
 
         return parts[0].get("text", "")
+
+    def _retry_delay(self, resp: httpx.Response, attempt: int) -> float | None:
+        """Seconds to wait before retrying ``resp``, or ``None`` to give up."""
+        if resp.status_code not in self._RETRY_STATUSES:
+            return None
+        if attempt + 1 >= self._MAX_ATTEMPTS:
+            return None
+        try:
+            delay = float(resp.headers.get("retry-after", ""))
+        except ValueError:
+            delay = 0.5 * 2 ** attempt
+        return min(delay, self._MAX_RETRY_DELAY)
+
+    @staticmethod
+    def _log_error(resp: httpx.Response) -> None:
+        if resp.status_code >= 400:
+            logger.error(
+                "Gemini API error %s: %s",
+                resp.status_code,
+                resp.text[:500],
+            )
+
+    async def complete(self, messages: list[dict]) -> str:
+        """Call Gemini generateContent and return the raw text."""
+        url = (
+            f"{self._BASE_URL}/models/{self.model}:generateContent"
+        )
+        body = self._build_body(messages)
+
+        # Shared pooled client: the API key travels per request
+        client = http_client.get_client()
+        for attempt in range(self._MAX_ATTEMPTS):
+            resp = await client.post(
+                url,
+                json=body,
+                params={"key": self.api_key},
+                timeout=self._TIMEOUT,
+            )
+            delay = self._retry_delay(resp, attempt)
+            if delay is None:
+                break
+            await asyncio.sleep(delay)
+
+        self._log_error(resp)
+        resp.raise_for_status()
+        return self._candidate_text(orjson.loads(resp.content))
+
+    async def stream(self, messages: list[dict]) -> AsyncIterator[str]:
+        """Call Gemini streamGenerateContent and yield text chunks.
+
+        Uses the ``alt=sse`` transport: one ``data: {JSON}`` line per
+        chunk, each carrying a partial candidate. Retries only happen
+        before the first chunk, on the response status.
+        """
+        url = (
+            f"{self._BASE_URL}/models/{self.model}:streamGenerateContent"
+        )
+        body = self._build_body(messages)
+
+        client = http_client.get_client()
+        for attempt in range(self._MAX_ATTEMPTS):
+            async with client.stream(
+                "POST",
+                url,
+                json=body,
+                params={"key": self.api_key, "alt": "sse"},
+                timeout=self._TIMEOUT,
+            ) as resp:
+                delay = self._retry_delay(resp, attempt)
+                if delay is None:
+                    if resp.status_code >= 400:
+                        await resp.aread()
+                        self._log_error(resp)
+                    resp.raise_for_status()
+                    async for line in resp.aiter_lines():
+                        if not line.startswith("data:"):
+                            continue
+                        text = self._candidate_text(orjson.loads(line[5:]))
+                        if text:
+                            yield text
+                    return
+            await asyncio.sleep(delay)
@@ -13,18 +13,29 @@ No external agent frameworks — pure Python.
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
+import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, AsyncGenerator
 
-from src.application.agent import skill_registry
+import orjson
+
+from src.application.agent import response_cache, skill_registry
 from src.application.agent.llm_provider import LLMProvider
 
 logger = logging.getLogger(__name__)
 
 MAX_ITERATIONS = 8
 
+# Wall-clock budgets (seconds): per LLM call, per skill call, per run.
+# A timed-out step is reported and the loop moves on; the run deadline
+# caps every step so a run never outlives it.
+LLM_TIMEOUT = 30.0
+SKILL_TIMEOUT = 10.0
+RUN_TIMEOUT = 120.0
+
 
 @dataclass
 class AgentResult:
@@ -37,18 +48,29 @@ class AgentResult:
     error: str | None = None
 
 
+@lru_cache(maxsize=4)
+def _render_skills_block(registry_version: int) -> str:
+    """Render the skills catalog; keyed by the registry version."""
+    return "\n".join(
+        f"  - **{s['name']}**: {s['description']}\n"
+        f"    params: {orjson.dumps(s['params_schema']).decode()}"
+        for s in skill_registry.list_skills()
+    )
+
+
 def _build_default_system_prompt(tenant_schema: dict) -> str:
     """Build a generic system prompt (fallback when no custom prompt is given)."""
-    skills = skill_registry.list_skills()
+    skills_block = _render_skills_block(skill_registry.version())
+    schema_block = orjson.dumps(tenant_schema, option=orjson.OPT_INDENT_2).decode()
+    return _render_default_prompt(skills_block, schema_block)
 
-    skills_block = "\n".join(
-        f"  - **{s['name']}**: {s['description']}\n"
-        f"    params: {json.dumps(s['params_schema'], ensure_ascii=False)}"
-        for s in skills
-    )
 
-    schema_block = json.dumps(tenant_schema, indent=2, ensure_ascii=False)
+@lru_cache(maxsize=256)
+def _render_default_prompt(skills_block: str, schema_block: str) -> str:
+    """Fill the default prompt template; memoized on its rendered inputs.
 
+    The tenant schema goes last to keep the cacheable prefix tenant-free.
+    """
     return f"""You are an ERP product registration assistant.
 
 Your goal is to help the user fill in product data by using the available skills
@@ -57,11 +79,6 @@ to fetch and classify information automatically.
 ## Available Skills
 {skills_block}
 
-## Tenant Product Schema (fields to fill)
-```json
-{schema_block}
-```
-
 ## Response Format
 You MUST respond with valid JSON only. No markdown, no extra text.
 
@@ -77,42 +94,261 @@ Rules:
 - Fill as many fields as possible from the gathered data.
 - For fields you cannot determine, use null.
 - Always respond with valid JSON.
+
+## Tenant Product Schema (fields to fill)
+```json
+{schema_block}
+```
 """
 
 
+# Optional markdown fences around the reply; the closing one is usually
+# missing, since streamed replies are cut where the JSON object ends
+_FENCE_RE = re.compile(r"^\s*(?:```(?:json)?\s*)?(.*?)\s*(?:```\s*)?$", re.DOTALL)
+# Lenient repairs for the usual near-JSON slips, tried only on failure.
+# String literals are matched first so their contents are left alone.
+_REPAIR_RE = re.compile(
+    r'"(?:[^"\\]|\\.)*"'                       # string literal: kept
+    r"|,(?=\s*[}\]])"                           # trailing comma: dropped
+    r"|(?<=[{,])(\s*)([A-Za-z_]\w*)(?=\s*:)"    # bare key: quoted
+)
+
+
+def _repair(match: re.Match) -> str:
+    """Replacement for one ``_REPAIR_RE`` match."""
+    if match.group(2):
+        return f'{match.group(1)}"{match.group(2)}"'
+    text = match.group()
+    return "" if text == "," else text
+
+
 def _parse_llm_response(raw_response: str) -> dict | None:
-    """Parse LLM response, stripping markdown fences if present."""
-    clean = raw_response.strip()
-    if clean.startswith("```"):
-        clean = clean.split("\n", 1)[-1]
-    if clean.endswith("```"):
-        clean = clean.rsplit("```", 1)[0]
-    clean = clean.strip()
+    """Parse LLM response, stripping markdown fences if present.
+
+    Replies with trailing commas or unquoted keys are repaired rather
+    than costing a whole iteration on a re-prompt.
+    """
+    clean = _FENCE_RE.match(raw_response).group(1)
+    try:
+        return orjson.loads(clean)
+    except orjson.JSONDecodeError:
+        pass
+
+    repaired = _REPAIR_RE.sub(_repair, clean)
     try:
-        return json.loads(clean)
-    except json.JSONDecodeError:
+        return orjson.loads(repaired)
+    except orjson.JSONDecodeError:
         return None
 
 
+# NCM descriptions are long legal texts; the head identifies the code
+_NCM_DESCRICAO_CHARS = 120
+
+
+def _compact_skill_result(action: str, skill_result: Any) -> Any:
+    """Trim a skill result to what the LLM needs for its next step.
+
+    Every iteration re-sends the whole conversation, so each byte fed
+    back is paid again on all later turns. The full result is still
+    what the step (and the SSE client) reports.
+    """
+    if action == "classify_ncm" and isinstance(skill_result, dict):
+        candidates = skill_result.get("candidates")
+        if candidates:
+            # sujeito_is is summarized by the top-level tipo_produto hint
+            return {
+                **skill_result,
+                "candidates": [
+                    {
+                        "codigo": c["codigo"],
+                        "descricao": c["descricao"][:_NCM_DESCRICAO_CHARS],
+                    }
+                    for c in candidates
+                ],
+            }
+    return skill_result
+
+
+def _dump_result(skill_result: Any) -> str:
+    """Serialize a skill result for the LLM; unknown types become ``str``."""
+    return orjson.dumps(
+        skill_result, default=str, option=orjson.OPT_NON_STR_KEYS,
+    ).decode()
+
+
+class _ObjectScanner:
+    """Track, chunk by chunk, whether a top-level JSON object has closed.
+
+    Only braces outside strings are counted, so the scan is one cheap
+    pass over each chunk; anything before the first ``{`` (such as a
+    markdown fence) is skipped.
+    """
+
+    __slots__ = ("depth", "in_string", "escaped")
+
+    def __init__(self) -> None:
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+
+    def feed(self, chunk: str) -> bool:
+        """Consume ``chunk``; ``True`` once the outer object is complete."""
+        for ch in chunk:
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif ch == "\\":
+                    self.escaped = True
+                elif ch == '"':
+                    self.in_string = False
+            elif ch == '"':
+                self.in_string = self.depth > 0
+            elif ch == "{":
+                self.depth += 1
+            elif ch == "}" and self.depth:
+                self.depth -= 1
+                if not self.depth:
+                    return True
+        return False
+
+
+async def _complete_streamed(llm: LLMProvider, messages: list[dict]) -> str:
+    """Read the LLM reply as a stream, stopping at the end of its JSON.
+
+    Replies are a single JSON object, so once it closes the rest of the
+    generation (a closing fence, stray prose) is never waited for: the
+    stream is closed, which aborts the request upstream.
+    """
+    scanner = _ObjectScanner()
+    chunks: list[str] = []
+    stream = llm.stream(messages)
+    try:
+        async for chunk in stream:
+            chunks.append(chunk)
+            if scanner.feed(chunk):
+                break
+    finally:
+        await stream.aclose()
+    return "".join(chunks)
+
+
+def _append_skill_turn(
+    messages: list[dict], raw_response: str, action: str, skill_result: Any,
+) -> None:
+    """Record a skill call and feed its result back to the LLM."""
+    messages.append({"role": "model", "content": raw_response})
+    messages.append({
+        "role": "user",
+        "content": (
+            f"Skill '{action}' returned:\n"
+            f"```json\n{_dump_result(_compact_skill_result(action, skill_result))}\n```\n"
+            "Based on this result, decide your next action or produce the final draft."
+        ),
+    })
+
+
+# A standalone EAN-8 or EAN-13/GTIN-12/14 in the request
+_EAN_RE = re.compile(r"(?<!\d)(\d{8}|\d{12,14})(?!\d)")
+_EAN_FIELDS = ("name", "brand", "description", "foto_url")
+
+
+def _is_gtin(code: str) -> bool:
+    """Check the GTIN mod-10 check digit (EAN-8, UPC-A, EAN-13, GTIN-14)."""
+    body, check = code[:-1], int(code[-1])
+    # Weights alternate 3, 1, ... starting from the digit next to the check
+    total = sum(
+        int(d) * (3 if i % 2 == 0 else 1) for i, d in enumerate(reversed(body))
+    )
+    return (10 - total % 10) % 10 == check
+
+
+async def _preload_ean(
+    user_input: str,
+    messages: list[dict],
+    context: dict,
+    run_deadline: float,
+) -> dict | None:
+    """Look up a barcode from the request before the first LLM call.
+
+    The first thing the LLM does with an EAN is call ``fetch_by_ean``;
+    running it up front and recording the exchange as if the LLM had
+    asked saves that whole iteration. Only digit runs with a valid GTIN
+    check digit count, so order numbers and dates are not looked up.
+    Returns the step, or ``None`` when there is no EAN, the lookup fails
+    or finds nothing (the loop then proceeds as usual).
+    """
+    skill_fn = skill_registry.get("fetch_by_ean")
+    if skill_fn is None:
+        return None
+    ean = next(
+        (m.group(1) for m in _EAN_RE.finditer(user_input) if _is_gtin(m.group(1))),
+        None,
+    )
+    if ean is None:
+        return None
+
+    params = {"ean": ean}
+    try:
+        async with asyncio.timeout_at(_step_deadline(SKILL_TIMEOUT, run_deadline)):
+            skill_result = await skill_fn(params, context)
+    except Exception as exc:
+        logger.warning("EAN preload failed: %r", exc)
+        return None
+    if all(skill_result.get(field) is None for field in _EAN_FIELDS):
+        # Unknown product: leave the conversation untouched
+        return None
+
+    raw_response = orjson.dumps({"action": "fetch_by_ean", "params": params}).decode()
+    _append_skill_turn(messages, raw_response, "fetch_by_ean", skill_result)
+    return {
+        "iteration": 0,
+        "type": "skill_call",
+        "action": "fetch_by_ean",
+        "params": params,
+        "result": skill_result,
+    }
+
+
+def _step_deadline(timeout: float, run_deadline: float) -> float:
+    """Loop time at which a step must end: its own budget or the run's."""
+    return min(asyncio.get_running_loop().time() + timeout, run_deadline)
+
+
 async def _execute_iteration(
     iteration: int,
     messages: list[dict],
     llm: LLMProvider,
     context: dict,
+    run_deadline: float,
 ) -> dict:
     """Execute a single iteration of the ReAct loop.
 
+    ``run_deadline`` is the event-loop time at which the run expires.
+
     Returns a step dict describing what happened.
     """
-    # ── Call LLM ─────────────────────────────────────────────────
-    try:
-        raw_response = await llm.complete(messages)
-    except Exception as exc:
-        logger.error("LLM call failed at iteration %d: %s", iteration, exc)
-        return {"iteration": iteration, "type": "llm_error", "error": str(exc)}
+    # ── Call LLM (exact-match cache first) ───────────────────────
+    raw_response = response_cache.get(llm, messages)
+    cache_hit = raw_response is not None
+    if not cache_hit:
+        try:
+            async with asyncio.timeout_at(_step_deadline(LLM_TIMEOUT, run_deadline)):
+                raw_response = await response_cache.coalesce(
+                    llm, messages, lambda: _complete_streamed(llm, messages),
+                )
+        except TimeoutError:
+            # Nothing was appended: the next iteration asks again
+            logger.warning("LLM call timed out at iteration %d", iteration)
+            return {"iteration": iteration, "type": "timeout", "stage": "llm"}
+        except Exception as exc:
+            logger.error("LLM call failed at iteration %d: %s", iteration, exc)
+            return {"iteration": iteration, "type": "llm_error", "error": str(exc)}
 
     # ── Parse JSON ───────────────────────────────────────────────
     parsed = _parse_llm_response(raw_response)
+    if parsed is not None and not cache_hit:
+        # Keyed on the messages as sent, before this turn is appended
+        response_cache.put(llm, messages, raw_response)
     if parsed is None:
         logger.warning(
             "Invalid JSON from LLM at iteration %d: %s",
@@ -151,7 +387,7 @@ async def _execute_iteration(
 
     skill_fn = skill_registry.get(action)
     if skill_fn is None:
-        available = [s["name"] for s in skill_registry.list_skills()]
+        available = sorted(skill_registry.skill_names())
         messages.append({"role": "model", "content": raw_response})
         messages.append({
             "role": "user",
@@ -161,21 +397,30 @@ async def _execute_iteration(
 
     # ── Execute skill ────────────────────────────────────────────
     try:
-        skill_result = await skill_fn(params, context)
+        async with asyncio.timeout_at(_step_deadline(SKILL_TIMEOUT, run_deadline)):
+            skill_result = await skill_fn(params, context)
+    except TimeoutError:
+        logger.warning("Skill '%s' timed out at iteration %d", action, iteration)
+        messages.append({"role": "model", "content": raw_response})
+        messages.append({
+            "role": "user",
+            "content": (
+                f"Skill '{action}' timed out. Pick another action "
+                "or produce the final draft with the data you have."
+            ),
+        })
+        return {
+            "iteration": iteration,
+            "type": "timeout",
+            "stage": "skill",
+            "action": action,
+            "params": params,
+        }
     except Exception as exc:
         logger.error("Skill '%s' failed: %s", action, exc)
         skill_result = {"error": str(exc)}
 
-    # Feed result back to LLM
-    messages.append({"role": "model", "content": raw_response})
-    messages.append({
-        "role": "user",
-        "content": (
-            f"Skill '{action}' returned:\n"
-            f"```json\n{json.dumps(skill_result, ensure_ascii=False, default=str)}\n```\n"
-            "Based on this result, decide your next action or produce the final draft."
-        ),
-    })
+    _append_skill_turn(messages, raw_response, action, skill_result)
 
     return {
         "iteration": iteration,
@@ -219,10 +464,22 @@ async def run_agent(
         {"role": "user", "content": user_input},
     ]
 
+    loop = asyncio.get_running_loop()
+    run_deadline = loop.time() + RUN_TIMEOUT
+
+    preloaded = await _preload_ean(user_input, messages, context, run_deadline)
+    if preloaded is not None:
+        result.steps.append(preloaded)
+
     for iteration in range(1, MAX_ITERATIONS + 1):
+        if loop.time() >= run_deadline:
+            result.error = f"Time limit ({RUN_TIMEOUT:.0f}s) reached without completion"
+            break
         result.iterations = iteration
 
-        step = await _execute_iteration(iteration, messages, llm, context)
+        step = await _execute_iteration(
+            iteration, messages, llm, context, run_deadline,
+        )
         result.steps.append(step)
 
         if step["type"] == "llm_error":
@@ -265,8 +522,31 @@ async def run_agent_stream(
         {"role": "user", "content": user_input},
     ]
 
+    loop = asyncio.get_running_loop()
+    run_deadline = loop.time() + RUN_TIMEOUT
+
+    preloaded = await _preload_ean(user_input, messages, context, run_deadline)
+    if preloaded is not None:
+        yield {
+            "done": False,
+            "step": preloaded["type"],
+            "iteration": 0,
+            "skill": preloaded["action"],
+            "result": preloaded["result"],
+        }
+
     for iteration in range(1, MAX_ITERATIONS + 1):
-        step = await _execute_iteration(iteration, messages, llm, context)
+        if loop.time() >= run_deadline:
+            yield {
+                "done": True,
+                "error": f"Time limit ({RUN_TIMEOUT:.0f}s) reached",
+                "iteration": iteration - 1,
+            }
+            return
+
+        step = await _execute_iteration(
+            iteration, messages, llm, context, run_deadline,
+        )
 
         if step["type"] == "llm_error":
             yield {"done": True, "error": step["error"], "iteration": iteration}
@@ -7,21 +7,23 @@ registration workflow: EAN lookup → NCM classification → draft assembly.
 from __future__ import annotations
 
 import json
-from typing import Any
+from typing import Any, Sequence
 
 
 def build_system_prompt(
-    skills: list[dict],
+    skills: Sequence[dict],
     tenant_schema: dict,
 ) -> str:
     """Build a system prompt tailored for product enrichment.
 
     Args:
-        skills: List of skill metadata dicts from ``skill_registry.list_skills()``.
+        skills: Skill metadata dicts, e.g. the tuple from
+            ``skill_registry.list_skills()``.
         tenant_schema: Dict describing custom product fields for the tenant.
 
     Returns:
-        System prompt string.
+        System prompt string. The tenant schema is the final section, so
+        every tenant shares the same prompt prefix.
     """
     skills_block = "\n".join(
         f"  - **{s['name']}**: {s['description']}\n"
@@ -39,11 +41,6 @@ in the correct sequence to fill as many fields as possible.
 ## Available Skills
 {skills_block}
 
-## Tenant Product Schema (fields to fill in the draft)
-```json
-{schema_block}
-```
-
 ## Target Draft Fields
 The final draft MUST include these fields (use null for unknown values):
 - name: Product name
@@ -82,4 +79,9 @@ To call a skill:
 
 When ready to produce the final product draft:
 {{"done": true, "draft": {{...}}}}
+
+## Tenant Product Schema (fields to fill in the draft)
+```json
+{schema_block}
+```
 """
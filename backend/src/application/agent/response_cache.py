@@ -0,0 +1,103 @@
+"""Exact-match cache of LLM responses for the agent ReAct loop.
+
+Product enrichment is highly repetitive: the same description or EAN
+is enriched again and again, and the first LLM turn (system prompt +
+user input) is then byte-identical. Caching ``raw_response`` by a
+digest of the full message list turns those turns into a dict lookup.
+
+Later turns embed skill results in the messages, so they only hit when
+the whole conversation so far is identical. Only responses that parsed
+as valid JSON are stored (see ``orchestrator._execute_iteration``).
+
+Identical requests that arrive while the first one is still waiting
+on the LLM are coalesced onto that one call (``coalesce``).
+
+In-process and bounded; each worker keeps its own cache.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+from threading import Lock
+from typing import Awaitable, Callable
+
+import orjson
+from cachetools import TTLCache
+
+from src.application.agent.llm_provider import LLMProvider
+
+_MAXSIZE = 2048
+_TTL = 24 * 60 * 60  # seconds
+
+_cache: TTLCache = TTLCache(maxsize=_MAXSIZE, ttl=_TTL)
+_lock = Lock()
+# Calls currently in flight, by key; only touched from the event loop
+_inflight: dict[bytes, asyncio.Future] = {}
+
+
+def _key(llm: LLMProvider, messages: list[dict]) -> bytes:
+    # The model is part of the key: providers differ in their answers
+    model = getattr(llm, "model", type(llm).__name__)
+    payload = orjson.dumps([model, messages], option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+def get(llm: LLMProvider, messages: list[dict]) -> str | None:
+    """Return a cached response for this exact message list, if any."""
+    if not llm.cache_enabled:
+        return None
+    key = _key(llm, messages)
+    with _lock:
+        return _cache.get(key)
+
+
+def put(llm: LLMProvider, messages: list[dict], raw_response: str) -> None:
+    """Remember the response produced for ``messages``."""
+    if not llm.cache_enabled:
+        return
+    key = _key(llm, messages)
+    with _lock:
+        _cache[key] = raw_response
+
+
+async def coalesce(
+    llm: LLMProvider,
+    messages: list[dict],
+    fetch: Callable[[], Awaitable[str]],
+) -> str:
+    """Run ``fetch()`` once for concurrent requests with identical messages.
+
+    Followers share the first caller's result (or exception). If that
+    caller is cancelled, e.g. its client disconnected, they fetch for
+    themselves instead.
+    """
+    if not llm.cache_enabled:
+        return await fetch()
+    key = _key(llm, messages)
+
+    pending = _inflight.get(key)
+    if pending is not None:
+        try:
+            return await asyncio.shield(pending)
+        except asyncio.CancelledError:
+            if not pending.cancelled():
+                raise
+        return await fetch()
+
+    future = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        raw_response = await fetch()
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as exc:
+        future.set_exception(exc)
+        future.exception()  # retrieved: no warning when nobody waits
+        raise
+    else:
+        future.set_result(raw_response)
+        return raw_response
+    finally:
+        del _inflight[key]
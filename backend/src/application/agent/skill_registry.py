@@ -33,6 +33,15 @@ class SkillEntry:
 
 # Module-level singleton registry
 _registry: dict[str, SkillEntry] = {}
+# name -> fn, kept in step with ``_registry`` for the per-call lookup
+_dispatch: dict[str, SkillFn] = {}
+
+# Bumped on every ``register()``; lets callers key caches on the
+# registry contents without hashing them.
+_version = 0
+# Read-only views rebuilt by ``register()``, handed out as-is
+_skills_snapshot: tuple[dict, ...] = ()
+_skill_names: frozenset[str] = frozenset()
 
 
 def register(
@@ -42,30 +51,48 @@ def register(
     params_schema: dict | None = None,
 ) -> None:
     """Register a skill function under the given name."""
+    global _version, _skills_snapshot, _skill_names
+    _version += 1
     _registry[name] = SkillEntry(
         name=name,
         fn=fn,
         description=description,
         params_schema=params_schema or {},
     )
-
-
-def get(name: str) -> SkillFn | None:
-    """Return the callable for a registered skill, or None."""
-    entry = _registry.get(name)
-    return entry.fn if entry else None
-
-
-def list_skills() -> list[dict]:
-    """Return metadata for all registered skills (in-memory only)."""
-    return [
+    _dispatch[name] = fn
+    _skills_snapshot = tuple(
         {
             "name": entry.name,
             "description": entry.description,
             "params_schema": entry.params_schema,
         }
         for entry in _registry.values()
-    ]
+    )
+    _skill_names = frozenset(_registry)
+
+
+def get(name: str) -> SkillFn | None:
+    """Return the callable for a registered skill, or None."""
+    return _dispatch.get(name)
+
+
+def version() -> int:
+    """Return a counter that changes whenever the registry changes."""
+    return _version
+
+
+def list_skills() -> tuple[dict, ...]:
+    """Return metadata for all registered skills (in-memory only).
+
+    The same snapshot is returned until the registry changes; callers
+    must not mutate the skill dicts.
+    """
+    return _skills_snapshot
+
+
+def skill_names() -> frozenset[str]:
+    """Return the names of all registered skills."""
+    return _skill_names
 
 
 def list_skills_for_tenant(db: Session, tenant_id: str) -> list[dict]:
@@ -78,7 +105,7 @@ def list_skills_for_tenant(db: Session, tenant_id: str) -> list[dict]:
 
     stmt = select(SkillModel).where(
         SkillModel.tenant_id == tenant_id,
-        SkillModel.enabled == True,  # noqa: E712
+        SkillModel.enabled.is_(True),
     )
     db_skills = db.execute(stmt).scalars().all()
 
@@ -107,7 +134,7 @@ def get_skill_entry(db: Session, tenant_id: str, name: str) -> dict | None:
     stmt = select(SkillModel).where(
         SkillModel.tenant_id == tenant_id,
         SkillModel.name == name,
-        SkillModel.enabled == True,  # noqa: E712
+        SkillModel.enabled.is_(True),
     )
     db_skill = db.execute(stmt).scalar_one_or_none()
     if db_skill is None:
@@ -9,13 +9,91 @@ Contract: async def classify_ncm(params: dict, context: dict) -> dict
 
 from __future__ import annotations
 
-from sqlalchemy import select
+import asyncio
+from functools import lru_cache
+from threading import Lock
+
+from cachetools import TTLCache
+from sqlalchemy import Engine, Select, Table, bindparam, select
 
 from src.application.agent import skill_registry
 from src.infrastructure.persistence.sqlalchemy.models import Base
 
 _DEFAULT_MAX_RESULTS = 5
 
+# The NCM catalog only changes through seeds/migrations, while the same
+# categories come back over and over during catalog onboarding. Results
+# are cached per (normalized category, max_results); empty results
+# expire sooner so a freshly seeded catalog is picked up quickly. Bump
+# _CATALOG_VERSION when a migration changes the catalog contents.
+_CATALOG_VERSION = 1
+_HIT_CACHE_MAXSIZE = 4096
+_HIT_CACHE_TTL = 60 * 60  # seconds
+_MISS_CACHE_MAXSIZE = 1024
+_MISS_CACHE_TTL = 5 * 60  # seconds
+
+_hit_cache: TTLCache = TTLCache(maxsize=_HIT_CACHE_MAXSIZE, ttl=_HIT_CACHE_TTL)
+_miss_cache: TTLCache = TTLCache(maxsize=_MISS_CACHE_MAXSIZE, ttl=_MISS_CACHE_TTL)
+_cache_lock = Lock()
+
+
+_ncm_table: Table | None = None
+
+
+def _get_ncm_table() -> Table | None:
+    """Resolve the ``ncm`` table once.
+
+    Looked up lazily: the table is only in the metadata once the fiscal
+    catalog models have been imported. A miss is not remembered.
+    """
+    global _ncm_table
+    if _ncm_table is None:
+        _ncm_table = Base.metadata.tables.get("ncm")
+    return _ncm_table
+
+
+@lru_cache(maxsize=16)
+def _search_stmt(ncm_table: Table, term_count: int) -> Select:
+    """Build the search SELECT once per number of terms.
+
+    Terms and the limit are bound parameters (``term_0`` … and
+    ``max_results``), so every call with the same term count reuses one
+    statement and one compiled-cache entry.
+    """
+    stmt = select(
+        ncm_table.c.codigo,
+        ncm_table.c.descricao,
+        ncm_table.c.sujeito_is,
+    )
+    for i in range(term_count):
+        stmt = stmt.where(ncm_table.c.descricao.ilike(bindparam(f"term_{i}")))
+    return stmt.limit(bindparam("max_results"))
+
+
+def _search(
+    engine: Engine, ncm_table: Table, terms: list[str], max_results: int,
+) -> list[dict]:
+    """Run the search; each term must appear in the description.
+
+    Uses its own short-lived connection rather than the request Session:
+    this runs in a worker thread that a skill timeout may abandon while
+    the agent keeps using the Session on the event loop.
+    """
+    stmt = _search_stmt(ncm_table, len(terms))
+    binds = {f"term_{i}": f"%{term}%" for i, term in enumerate(terms)}
+    binds["max_results"] = max_results
+
+    with engine.connect() as conn:
+        # Plain tuple rows: no RowMapping wrapper per row
+        return [
+            {
+                "codigo": codigo,
+                "descricao": descricao,
+                "sujeito_is": bool(sujeito_is),
+            }
+            for codigo, descricao, sujeito_is in conn.execute(stmt, binds)
+        ]
+
 
 async def classify_ncm(params: dict, context: dict) -> dict:
     """Search the NCM catalog table by product category.
@@ -39,7 +117,7 @@ async def classify_ncm(params: dict, context: dict) -> dict:
     if db is None:
         return {"candidates": [], "error": "No database session in context"}
 
-    ncm_table = Base.metadata.tables.get("ncm")
+    ncm_table = _get_ncm_table()
     if ncm_table is None:
         return {"candidates": [], "error": "Table 'ncm' not found in metadata"}
 
@@ -48,26 +126,20 @@ async def classify_ncm(params: dict, context: dict) -> dict:
     if not terms:
         return {"candidates": []}
 
-    # Build query: each term must appear in the description
-    stmt = select(
-        ncm_table.c.codigo,
-        ncm_table.c.descricao,
-        ncm_table.c.sujeito_is,
-    )
-    for term in terms:
-        stmt = stmt.where(ncm_table.c.descricao.ilike(f"%{term}%"))
-    stmt = stmt.limit(max_results)
-
-    rows = db.execute(stmt).mappings().all()
-
-    candidates = [
-        {
-            "codigo": row["codigo"],
-            "descricao": row["descricao"],
-            "sujeito_is": bool(row["sujeito_is"]),
-        }
-        for row in rows
-    ]
+    # ILIKE is case-insensitive, so case and spacing do not change results
+    key = (_CATALOG_VERSION, " ".join(terms).lower(), max_results)
+    with _cache_lock:
+        candidates = _hit_cache.get(key)
+        if candidates is None:
+            candidates = _miss_cache.get(key)
+
+    if candidates is None:
+        # Sync driver: keep the round-trip off the event loop
+        candidates = await asyncio.to_thread(
+            _search, db.get_bind().engine, ncm_table, terms, max_results,
+        )
+        with _cache_lock:
+            (_hit_cache if candidates else _miss_cache)[key] = candidates
 
     # If any candidate is a fuel NCM (sujeito_is=True), hint the agent
     # to set tipo_produto='combustivel' in the product draft.
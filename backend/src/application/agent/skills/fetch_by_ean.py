@@ -10,8 +10,9 @@ Contract: async def fetch_by_ean(params: dict, context: dict) -> dict
 from __future__ import annotations
 
 import httpx
+import orjson
 
-from src.application.agent import skill_registry
+from src.application.agent import http_client, skill_registry
 
 _OFF_URL = "https://mundo.openfoodfacts.org/api/v0/product/{ean}.json"
 _TIMEOUT = 10  # seconds
@@ -35,10 +36,11 @@ async def fetch_by_ean(params: dict, context: dict) -> dict:
         return empty
 
     try:
-        async with httpx.AsyncClient(timeout=_TIMEOUT) as client:
-            resp = await client.get(_OFF_URL.format(ean=ean))
-            resp.raise_for_status()
-            data = resp.json()
+        resp = await http_client.get_client().get(
+            _OFF_URL.format(ean=ean), timeout=_TIMEOUT,
+        )
+        resp.raise_for_status()
+        data = orjson.loads(resp.content)
     except (httpx.HTTPError, ValueError):
         return empty
 
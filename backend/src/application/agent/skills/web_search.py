@@ -9,24 +9,42 @@ Contract: async def web_search(params: dict, context: dict) -> dict
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
+import re
+from threading import Lock
 from urllib.parse import quote_plus
 
 import httpx
-from bs4 import BeautifulSoup
+import orjson
+from cachetools import TTLCache
+from bs4 import BeautifulSoup, SoupStrainer
 
-from src.application.agent import skill_registry
+from src.application.agent import http_client, skill_registry
 
 logger = logging.getLogger(__name__)
 
 _DDG_INSTANT_URL = "https://api.duckduckgo.com/"
 _DDG_HTML_URL = "https://html.duckduckgo.com/html/"
 _TIMEOUT = 10
+# Instant Answer usually replies well within this; only slower calls
+# get the HTML scrape started alongside them.
+_HEDGE_DELAY = 0.5  # seconds
 _USER_AGENT = (
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
     "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 )
 
+# Agents repeat the same searches (retries, re-enrichment of a product);
+# non-empty results are reused for an hour. Empty ones are not cached:
+# the helpers also return [] on network errors.
+_CACHE_MAXSIZE = 1024
+_CACHE_TTL = 60 * 60  # seconds
+
+_cache: TTLCache = TTLCache(maxsize=_CACHE_MAXSIZE, ttl=_CACHE_TTL)
+_cache_lock = Lock()
+
 
 async def _try_instant_answer(client: httpx.AsyncClient, query: str) -> list[dict]:
     """Try the DuckDuckGo Instant Answer API first."""
@@ -34,9 +52,11 @@ async def _try_instant_answer(client: httpx.AsyncClient, query: str) -> list[dic
         resp = await client.get(
             _DDG_INSTANT_URL,
             params={"q": query, "format": "json", "no_html": "1", "skip_disambig": "1"},
+            timeout=_TIMEOUT,
+            follow_redirects=True,
         )
         resp.raise_for_status()
-        data = resp.json()
+        data = orjson.loads(resp.content)
     except (httpx.HTTPError, ValueError):
         return []
 
@@ -62,6 +82,10 @@ async def _try_instant_answer(client: httpx.AsyncClient, query: str) -> list[dic
     return results
 
 
+# The strainer sees the raw class attribute, not the split class list
+_RESULTS_ONLY = SoupStrainer(class_=re.compile(r"(?:^|\s)result__body(?:\s|$)"))
+
+
 async def _scrape_html_results(
     client: httpx.AsyncClient, query: str, max_results: int,
 ) -> list[dict]:
@@ -71,16 +95,20 @@ async def _scrape_html_results(
             _DDG_HTML_URL,
             data={"q": query},
             headers={"User-Agent": _USER_AGENT},
+            timeout=_TIMEOUT,
+            follow_redirects=True,
         )
         resp.raise_for_status()
     except httpx.HTTPError as exc:
         logger.warning("web_search HTML scrape failed: %s", exc)
         return []
 
-    soup = BeautifulSoup(resp.text, "html.parser")
+    # Only result blocks become tree nodes; the rest of the page is
+    # tokenized and dropped
+    soup = BeautifulSoup(resp.text, "html.parser", parse_only=_RESULTS_ONLY)
     results: list[dict] = []
 
-    for item in soup.select(".result__body")[:max_results]:
+    for item in soup.select(".result__body", limit=max_results):
         title_el = item.select_one(".result__title a")
         snippet_el = item.select_one(".result__snippet")
 
@@ -110,15 +138,45 @@ async def web_search(params: dict, context: dict) -> dict:
     if not query:
         return {"results": [], "error": "Empty query"}
 
-    async with httpx.AsyncClient(timeout=_TIMEOUT, follow_redirects=True) as client:
-        # Try Instant Answer API first
-        results = await _try_instant_answer(client, query)
-
-        # If no meaningful results, fall back to HTML scraping
+    key = (" ".join(query.lower().split()), max_results)
+    with _cache_lock:
+        cached = _cache.get(key)
+    if cached is not None:
+        return {"results": cached}
+
+    client = http_client.get_client()
+
+    # Instant Answer is preferred, but is often empty for product
+    # queries. If it has not answered within _HEDGE_DELAY, the HTML
+    # scrape is started alongside it, so a slow miss costs about
+    # max(IA, delay + scrape) instead of IA + scrape. A quick answer
+    # with results sends no second request at all.
+    instant = asyncio.create_task(_try_instant_answer(client, query))
+    scrape: asyncio.Task | None = None
+    try:
+        done, _ = await asyncio.wait({instant}, timeout=_HEDGE_DELAY)
+        if not done:
+            scrape = asyncio.create_task(
+                _scrape_html_results(client, query, max_results)
+            )
+        results = await instant
         if not results:
-            results = await _scrape_html_results(client, query, max_results)
-
-    return {"results": results[:max_results]}
+            if scrape is None:
+                results = await _scrape_html_results(client, query, max_results)
+            else:
+                results = await scrape
+    finally:
+        for task in (instant, scrape):
+            if task is not None and not task.done():
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+
+    results = results[:max_results]
+    if results:
+        with _cache_lock:
+            _cache[key] = results
+    return {"results": results}
 
 
 # ── Auto-register ───────────────────────────────────────────────────
@@ -7,10 +7,10 @@ the relative path for database storage.
 
 from __future__ import annotations
 
-import base64
+import binascii
 import logging
 import os
-import uuid
+import re
 from pathlib import Path
 from typing import Any
 
@@ -27,6 +27,28 @@ def _ensure_upload_dir() -> None:
     UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 
 
+# Fresh file only: never follow a planted symlink or reuse a path
+_BLOB_OPEN_FLAGS = (
+    os.O_WRONLY | os.O_CREAT | os.O_EXCL
+    | getattr(os, "O_NOFOLLOW", 0) | getattr(os, "O_BINARY", 0)
+)
+
+
+def _write_blob(filepath: Path, data: bytes) -> None:
+    """Write ``data`` to a new file with raw ``os.write`` calls.
+
+    Skips the buffered file object ``Path.write_bytes`` builds; the
+    payload is handed to the kernel straight from a memoryview.
+    """
+    fd = os.open(filepath, _BLOB_OPEN_FLAGS, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
 def image_to_blob(value: Any) -> Any:
     """Convert a base64-encoded image to a file on disk.
 
@@ -52,15 +74,16 @@ def image_to_blob(value: Any) -> Any:
         ext = "png"  # default
 
     try:
-        raw_bytes = base64.b64decode(b64_data)
+        # a2b_base64 takes the ASCII str as-is: no intermediate bytes
+        raw_bytes = binascii.a2b_base64(b64_data)
     except Exception:
         logger.warning("Invalid base64 data, storing as-is")
         return value
 
-    filename = f"{uuid.uuid4().hex}.{ext}"
+    filename = f"{os.urandom(16).hex()}.{ext}"
     filepath = UPLOAD_DIR / filename
 
-    filepath.write_bytes(raw_bytes)
+    _write_blob(filepath, raw_bytes)
     logger.info("Saved blob: %s (%d bytes)", filepath, len(raw_bytes))
 
     return str(filepath)
@@ -84,34 +107,37 @@ def blob_to_image(value: Any) -> Any:
         return value
 
     raw_bytes = filepath.read_bytes()
-    b64 = base64.b64encode(raw_bytes).decode("utf-8")
+    b64 = binascii.b2a_base64(raw_bytes, newline=False).decode("ascii")
     ext = filepath.suffix.lstrip(".")
     mime = _ext_to_mime(ext)
 
     return f"data:{mime};base64,{b64}"
 
 
+# data:image/png;base64 → png
+# The subtype becomes part of a file name: word characters and ``.+-``
+# only, starting with a word character, so no ``/`` or ``..`` gets in.
+_DATA_URI_RE = re.compile(r"data:[^/;,]*/(\w[\w.+-]*)(?=[;,]|$)")
+
+_MIME_TYPES = {
+    "png": "image/png",
+    "jpg": "image/jpeg",
+    "jpeg": "image/jpeg",
+    "gif": "image/gif",
+    "webp": "image/webp",
+    "svg": "image/svg+xml",
+}
+
+
 def _extract_extension(header: str) -> str:
-    """Extract file extension from data URI header."""
-    # data:image/png;base64 → png
-    try:
-        mime_part = header.split(":")[1].split(";")[0]
-        return mime_part.split("/")[1]
-    except (IndexError, KeyError):
-        return "png"
+    """Extract file extension from data URI header (``png`` if unsafe)."""
+    match = _DATA_URI_RE.match(header)
+    return match.group(1) if match else "png"
 
 
 def _ext_to_mime(ext: str) -> str:
     """Map file extension to MIME type."""
-    mime_map = {
-        "png": "image/png",
-        "jpg": "image/jpeg",
-        "jpeg": "image/jpeg",
-        "gif": "image/gif",
-        "webp": "image/webp",
-        "svg": "image/svg+xml",
-    }
-    return mime_map.get(ext.lower(), "application/octet-stream")
+    return _MIME_TYPES.get(ext.lower(), "application/octet-stream")
 
 
 # ── Auto-register ────────────────────────────────────────────────
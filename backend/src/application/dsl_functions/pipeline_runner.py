@@ -44,13 +44,38 @@ def run_response_pipeline(
     return _run_pipeline(data, schema, "response")
 
 
+def run_response_pipeline_many(
+    rows: list[dict[str, Any]],
+    schema: dict[str, Any],
+) -> list[dict[str, Any]]:
+    """Apply 'on=response' transforms to a batch of rows.
+
+    The schema's transform declarations are extracted once for the
+    whole batch instead of once per row.
+    """
+    fields_with_transforms = _get_field_transforms(schema)
+    if not fields_with_transforms:
+        return rows
+    return [
+        _apply_transforms(row, fields_with_transforms, "response")
+        for row in rows
+    ]
+
+
 def _run_pipeline(
     data: dict[str, Any],
     schema: dict[str, Any],
     phase: str,
 ) -> dict[str, Any]:
     """Internal: iterate fields with transforms, apply matching ones."""
-    fields_with_transforms = _get_field_transforms(schema)
+    return _apply_transforms(data, _get_field_transforms(schema), phase)
+
+
+def _apply_transforms(
+    data: dict[str, Any],
+    fields_with_transforms: list[dict[str, Any]],
+    phase: str,
+) -> dict[str, Any]:
     result = dict(data)
 
     for field_def in fields_with_transforms:
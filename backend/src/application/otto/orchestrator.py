@@ -18,6 +18,8 @@ import logging
 import re
 from typing import AsyncGenerator
 
+import orjson
+
 from src.application.agent import skill_registry
 from src.application.agent.llm_provider import LLMProvider
 from src.application.otto.prompts.otto_system import build_otto_system_prompt
@@ -119,6 +121,93 @@ def _extract_json(text: str) -> dict:
     return {"message": fallback_text.strip()}
 
 
+# Assistant deltas are by far the most frequent event: their envelope is
+# pre-encoded, only the text is serialized per chunk, and the SSE layer
+# forwards ``bytes`` events without re-encoding them.
+_DELTA_HEAD = b'{"role":"assistant","content":'
+_DELTA_TAIL = b',"done":false}'
+
+
+def _delta_event(text: str) -> bytes:
+    """Encode an assistant text delta as a ready-to-frame JSON event."""
+    return _DELTA_HEAD + orjson.dumps(text) + _DELTA_TAIL
+
+
+# A reply whose first key is "message" is a plain chat answer (or the
+# label of an action): its text can be shown while it is generated.
+_MESSAGE_HEAD_RE = re.compile(r'\s*(?:```(?:json)?\s*)?\{\s*"message"\s*:\s*"')
+
+
+# Past this many characters without a "message" key, the reply is not
+# a plain chat answer (the head is a fence, a brace and the key).
+_MESSAGE_HEAD_MAX_CHARS = 64
+
+
+class _MessageStream:
+    """Decode, chunk by chunk, the ``"message"`` value of a streaming reply.
+
+    Each chunk is scanned once: only the undecoded tail, at most an
+    escape sequence cut by the chunk boundary, is carried over to the
+    next ``feed``. Replies that do not open with a ``message`` key
+    produce no text.
+    """
+
+    __slots__ = ("head", "pending", "state")
+
+    _HEAD, _BODY, _DONE = range(3)
+
+    def __init__(self) -> None:
+        self.head = ""
+        self.pending = ""
+        self.state = self._HEAD
+
+    def feed(self, chunk: str) -> str:
+        """Consume ``chunk``; return the message text it completes."""
+        if self.state == self._DONE:
+            return ""
+        if self.state == self._HEAD:
+            self.head += chunk
+            match = _MESSAGE_HEAD_RE.match(self.head)
+            if match is None:
+                if len(self.head) > _MESSAGE_HEAD_MAX_CHARS:
+                    self.state = self._DONE
+                return ""
+            chunk = self.head[match.end():]
+            self.head = ""
+            self.state = self._BODY
+
+        text = self.pending + chunk
+        i, n = 0, len(text)
+        while i < n:
+            ch = text[i]
+            if ch == '"':
+                self.state = self._DONE
+                break
+            if ch == "\\":
+                width = 6 if text[i + 1:i + 2] == "u" else 2
+                # Keep a surrogate pair together: halves don't decode alone
+                if (
+                    width == 6
+                    and "d800" <= text[i + 2:i + 6].lower() < "dc00"
+                    and text[i + 6:i + 8] in ("\\u", "\\", "")
+                ):
+                    width = 12
+                if i + width > n:
+                    break
+                i += width
+                continue
+            i += 1
+        self.pending = text[i:] if self.state == self._BODY else ""
+
+        if not i:
+            return ""
+        try:
+            return json.loads('"' + text[:i] + '"', strict=False)
+        except json.JSONDecodeError:
+            self.state = self._DONE
+            return ""
+
+
 async def _try_workflow_command(
     user_input: str,
     context: dict,
@@ -145,7 +234,7 @@ async def _try_workflow_command(
     args_text = parts[1] if len(parts) > 1 else ""
 
     repo = SqlAlchemyWorkflowRepository(db)
-    workflow = repo.get_by_command(command, tenant_id)
+    workflow = await asyncio.to_thread(repo.get_by_command, command, tenant_id)
 
     if workflow is None:
         return None
@@ -164,11 +253,12 @@ async def run_otto_stream(
     context: dict | None = None,
     history: list[dict] | None = None,
     session: OttoSession | None = None,
-) -> AsyncGenerator[dict, None]:
+) -> AsyncGenerator[dict | bytes, None]:
     """Run the Otto ReAct loop as an async generator for SSE streaming.
 
     Yields dicts suitable for SSE ``data:`` events.
     Each event has ``role``, ``content``, and ``done`` fields.
+    Streamed assistant deltas arrive already JSON-encoded, as ``bytes``.
 
     Args:
         history: Previous conversation messages [{role, content}] for
@@ -210,9 +300,19 @@ async def run_otto_stream(
     messages.append({"role": "user", "content": user_input})
 
     for iteration in range(1, MAX_ITERATIONS + 1):
-        # ── Call LLM ────────────────────────────────────────────
+        # ── Call LLM (streamed) ─────────────────────────────────
+        # Plain message replies are forwarded as assistant deltas while
+        # the model is still generating; everything else waits for the
+        # full JSON.
+        chunks: list[str] = []
+        message_stream = _MessageStream()
         try:
-            raw_response = await llm.complete(messages)
+            async for chunk in llm.stream(messages):
+                chunks.append(chunk)
+                delta = message_stream.feed(chunk)
+                if delta:
+                    yield _delta_event(delta)
+            raw_response = "".join(chunks)
         except Exception as exc:
             logger.error("Otto LLM call failed at iteration %d: %s", iteration, exc)
             yield {
@@ -339,12 +439,13 @@ async def run_otto_stream(
             })
             continue
 
-        # Emit "thinking" event
-        yield {
-            "role": "assistant",
-            "content": parsed.get("message", f"Executando {action}…"),
-            "done": False,
-        }
+        # Emit "thinking" event, unless its text was already streamed
+        if not streamed:
+            yield {
+                "role": "assistant",
+                "content": parsed.get("message", f"Executando {action}…"),
+                "done": False,
+            }
 
         skill_fn = skill_registry.get(action)
         if skill_fn is None:
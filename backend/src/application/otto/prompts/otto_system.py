@@ -8,7 +8,7 @@ Sub-prompts are loaded dynamically from sibling modules based on context.
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Sequence
 
 from src.application.otto.prompts import cadastrar_produto
 
@@ -48,7 +48,7 @@ def _collect_sub_prompts(
 
 
 def build_otto_system_prompt(
-    skills: list[dict[str, Any]],
+    skills: Sequence[dict[str, Any]],
     page_key: str | None = None,
     page_schema: dict | None = None,
     user_input: str | None = None,
@@ -56,7 +56,8 @@ def build_otto_system_prompt(
     """Build a system prompt for the Otto agent.
 
     Args:
-        skills: List of registered skill descriptors.
+        skills: Registered skill descriptors (``list_skills()`` returns
+            a tuple).
         page_key: Current page key the user is viewing.
         page_schema: DSL schema of the current page.
         user_input: Current user message (used for sub-prompt selection).
@@ -131,6 +132,9 @@ O usuário NÃO está em nenhuma página de entidade no momento (pode estar no D
     # ── Domain-specific sub-prompts ─────────────────────────────────
     domain_prompts = _collect_sub_prompts(page_key, user_input)
 
+    # Page context and sub-prompts vary per request, so they go last:
+    # everything before them is a byte-identical prefix the provider can
+    # serve from its implicit prompt cache.
     return f"""CRITICAL: Your response MUST be valid JSON only. No explanatory text before or after the JSON. No markdown code blocks. Start your response with {{ and end with }}. Any text outside JSON will break the system.
 
 WRONG: 'Ok, vou buscar. {{"action": "classify_ncm", "params": ...}}'
@@ -247,7 +251,7 @@ call `create_entity` to save the record.
 **WHEN TO USE component:** Only for **self-contained widgets** (summary card, chart).
 **WHEN NOT TO USE:** NEVER render field components (`text`, `number`, etc.) in isolation.
 To **display** info → text message. To **collect** inputs → form. To render a **widget** → component.
-{skills_section}{context_section}{domain_prompts}
+{skills_section}
 ## Interactive Messages Guidelines
 **PREFER interactive messages over free-text questions** when:
 - You have 2-6 known options → use `choice`
@@ -322,4 +326,4 @@ This restores the most recently archived version.
 - ALWAYS maintain context from the conversation history.
 - ALWAYS prefer interactive messages over plain text questions when you have a limited set of options.
 - When the user navigates to a different page, the page context updates automatically.
-"""
+{context_section}{domain_prompts}"""
@@ -5,7 +5,6 @@ from __future__ import annotations
 from typing import Any, Optional
 
 from src.application.ports.page_repository_port import PageRepositoryPort
-from src.domain.entities.page_version import Scope
 
 
 class GetPageUseCase:
@@ -22,35 +21,17 @@ class GetPageUseCase:
     def execute(
         self, page_key: str, tenant_id: Optional[str] = None
     ) -> Optional[dict[str, Any]]:
-        # Try tenant-specific first
-        if tenant_id:
-            tenant_version = self._page_repo.get_published(
-                page_key, Scope.TENANT, tenant_id
-            )
-            if tenant_version:
-                return {
-                    "id": tenant_version.id,
-                    "page_key": tenant_version.page_key,
-                    "scope": tenant_version.scope.value,
-                    "tenant_id": tenant_version.tenant_id,
-                    "version_number": tenant_version.version_number,
-                    "schema": tenant_version.schema_json,
-                    "status": tenant_version.status.value,
-                }
-
-        # Fallback to global
-        global_version = self._page_repo.get_published(
-            page_key, Scope.GLOBAL
-        )
-        if global_version:
-            return {
-                "id": global_version.id,
-                "page_key": global_version.page_key,
-                "scope": global_version.scope.value,
-                "tenant_id": None,
-                "version_number": global_version.version_number,
-                "schema": global_version.schema_json,
-                "status": global_version.status.value,
-            }
-
-        return None
+        # Tenant-specific and global fallback resolved in one query
+        version = self._page_repo.get_published_resolved(page_key, tenant_id)
+        if version is None:
+            return None
+
+        return {
+            "id": version.id,
+            "page_key": version.page_key,
+            "scope": version.scope.value,
+            "tenant_id": version.tenant_id,
+            "version_number": version.version_number,
+            "schema": version.schema_json,
+            "status": version.status.value,
+        }
@@ -19,6 +19,12 @@ class PageRepository(Protocol):
         tenant_id: Optional[str] = None,
     ) -> Optional[PageVersion]: ...
 
+    def get_published_resolved(
+        self,
+        page_key: str,
+        tenant_id: Optional[str] = None,
+    ) -> Optional[PageVersion]: ...
+
     def get_versions(
         self,
         page_key: str,
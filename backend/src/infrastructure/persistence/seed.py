@@ -12,6 +12,7 @@ from passlib.context import CryptContext
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from src.infrastructure.config.settings import settings
 from src.infrastructure.persistence.seed_schemas import (
     DASHBOARD_SCHEMA,
     HEADER_SCHEMA,
@@ -46,7 +47,11 @@ from src.infrastructure.persistence.sqlalchemy.models import (
     UserModel,
 )
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=settings.bcrypt_rounds,
+)
 
 DEFAULT_TENANT_ID = "00000000-0000-0000-0000-000000000001"
 ADMIN_USER_ID = "00000000-0000-0000-0000-000000000002"
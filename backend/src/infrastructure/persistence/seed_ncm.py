@@ -21,6 +21,7 @@ _NCM_CSV_URL = (
     "https://raw.githubusercontent.com/jansenfelipe/ncm/master/ncm.csv"
 )
 _DOWNLOAD_TIMEOUT = 30  # seconds
+_INSERT_CHUNK_SIZE = 1000  # rows per batched INSERT
 
 
 # ── Fallback hardcoded subset (common retail NCMs) ──────────────────
@@ -194,19 +195,18 @@ def seed_ncm(session: Session) -> int:
         records = NCM_FALLBACK_DATA
         source = "fallback"
 
-    new_count = 0
+    rows: list[dict] = []
     for codigo, descricao in records:
         if codigo in existing_codes:
             continue
-        session.execute(
-            ncm_table.insert().values(
-                codigo=codigo,
-                descricao=descricao,
-                sujeito_is=False,
-            )
-        )
+        rows.append({"codigo": codigo, "descricao": descricao, "sujeito_is": False})
         existing_codes.add(codigo)
-        new_count += 1
+    new_count = len(rows)
+
+    # executemany per chunk → batched multi-row INSERTs, one transaction
+    insert_stmt = ncm_table.insert()
+    for start in range(0, new_count, _INSERT_CHUNK_SIZE):
+        session.execute(insert_stmt, rows[start:start + _INSERT_CHUNK_SIZE])
 
     if new_count:
         session.commit()
@@ -6,14 +6,16 @@ from datetime import datetime, timezone
 
 from sqlalchemy import (
     Boolean,
+    CheckConstraint,
     Column,
     DateTime,
-    Enum,
+    Index,
     Integer,
     String,
     Text,
+    text,
 )
-from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import DeclarativeBase
 
 from src.infrastructure.persistence.sqlalchemy.models import Base
@@ -23,6 +25,12 @@ class LLMProviderModel(Base):
     """LLM provider configuration per tenant."""
 
     __tablename__ = "llm_providers"
+    __table_args__ = (
+        Index(
+            "ix_llm_providers_active", "tenant_id",
+            postgresql_where=text("is_active"),
+        ),
+    )
 
     id = Column(String(36), primary_key=True)
     tenant_id = Column(String(36), nullable=False, index=True)
@@ -30,7 +38,7 @@ class LLMProviderModel(Base):
     model = Column(String(128), nullable=False)
     api_key_encrypted = Column(Text, nullable=False)
     base_url = Column(Text, nullable=True)
-    params = Column(JSON, nullable=True)
+    params = Column(JSONB, nullable=True)
     is_active = Column(Boolean, nullable=False, default=True)
     created_at = Column(
         DateTime(timezone=True),
@@ -52,7 +60,7 @@ class ChatSessionModel(Base):
     id = Column(String(36), primary_key=True)
     tenant_id = Column(String(36), nullable=False, index=True)
     user_id = Column(String(36), nullable=False, index=True)
-    context = Column(JSON, nullable=True)
+    context = Column(JSONB, nullable=True)
     created_at = Column(
         DateTime(timezone=True),
         default=lambda: datetime.now(timezone.utc),
@@ -68,18 +76,46 @@ class ChatMessageModel(Base):
     """Individual message in a chat session."""
 
     __tablename__ = "chat_messages"
+    __table_args__ = (
+        CheckConstraint(
+            "role IN ('user', 'agent', 'skill')",
+            name="ck_chat_messages_role",
+        ),
+    )
 
     id = Column(String(36), primary_key=True)
     session_id = Column(String(36), nullable=False, index=True)
     tenant_id = Column(String(36), nullable=False, index=True)
-    role = Column(
-        Enum("user", "agent", "skill", name="chat_role_enum"),
-        nullable=False,
-    )
+    role = Column(String(16), nullable=False)
     content = Column(Text, nullable=False)
     skill_name = Column(String(128), nullable=True)
-    metadata_json = Column(JSON, nullable=True)
+    metadata_json = Column(JSONB, nullable=True)
     created_at = Column(
         DateTime(timezone=True),
         default=lambda: datetime.now(timezone.utc),
     )
+
+
+# ── Composite indexes (mirrors migration a1b2c3d4e5f6) ───────────────
+
+Index(
+    "ix_chat_sessions_tenant_user_updated",
+    ChatSessionModel.tenant_id,
+    ChatSessionModel.user_id,
+    ChatSessionModel.updated_at.desc(),
+)
+Index(
+    "ix_chat_messages_session_created",
+    ChatMessageModel.session_id,
+    ChatMessageModel.created_at,
+)
+Index(
+    "ix_chat_messages_tenant_created",
+    ChatMessageModel.tenant_id,
+    ChatMessageModel.created_at,
+)
+Index(
+    "ix_chat_messages_metadata_gin",
+    ChatMessageModel.metadata_json,
+    postgresql_using="gin",
+)
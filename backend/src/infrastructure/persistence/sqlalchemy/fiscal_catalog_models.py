@@ -9,7 +9,7 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 
-from sqlalchemy import Boolean, Column, DateTime, Numeric, String, Text
+from sqlalchemy import DDL, Boolean, Column, DateTime, Index, Numeric, String, Text, event
 
 from src.infrastructure.persistence.sqlalchemy.models import Base
 
@@ -18,6 +18,14 @@ class NCMModel(Base):
     """Nomenclatura Comum do Mercosul."""
 
     __tablename__ = "ncm"
+    __table_args__ = (
+        # Serves classify_ncm's ``descricao ILIKE '%term%'`` filters
+        Index(
+            "ix_ncm_descricao_trgm", "descricao",
+            postgresql_using="gin",
+            postgresql_ops={"descricao": "gin_trgm_ops"},
+        ),
+    )
 
     codigo = Column(String(8), primary_key=True)
     descricao = Column(Text, nullable=False)
@@ -30,14 +38,28 @@ class NCMModel(Base):
     )
 
 
+# gin_trgm_ops needs the extension when tables are created outside Alembic
+event.listen(
+    NCMModel.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
+
 class CESTModel(Base):
     """Código Especificador da Substituição Tributária."""
 
     __tablename__ = "cest"
+    __table_args__ = (
+        Index(
+            "ix_cest_ncm_covering", "ncm_codigo",
+            postgresql_include=["codigo", "descricao"],
+        ),
+    )
 
     codigo = Column(String(7), primary_key=True)
     descricao = Column(Text, nullable=False)
-    ncm_codigo = Column(String(8), nullable=False, index=True)
+    ncm_codigo = Column(String(8), nullable=False)
 
 
 class ClassificacaoTributariaModel(Base):
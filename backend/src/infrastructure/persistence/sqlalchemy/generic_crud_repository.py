@@ -19,6 +19,9 @@ from sqlalchemy.orm import Session
 
 from src.infrastructure.persistence.sqlalchemy.models import Base
 
+# Result label of the windowed COUNT(*) in ``list``
+_TOTAL_LABEL = "__total_count"
+
 # Operator map for dynamic WHERE clauses
 _OP_MAP = {
     "eq": lambda col, val: col == val,
@@ -94,13 +97,10 @@ class GenericCrudRepository:
         # Base WHERE
         base_where = table.c.tenant_id == tenant_id
 
-        # Count (with filters)
-        count_q = select(func.count()).select_from(table).where(base_where)
-        count_q = self._apply_filters(count_q, table, filters)
-        total = self.db.execute(count_q).scalar() or 0
-
-        # Data (with filters + sort)
-        data_q = select(table).where(base_where)
+        # Data (with filters + sort); the window count carries the
+        # filtered total on every row, so one round-trip serves both.
+        total_col = func.count().over().label(_TOTAL_LABEL)
+        data_q = select(table, total_col).where(base_where)
         data_q = self._apply_filters(data_q, table, filters)
 
         # Sort
@@ -113,8 +113,22 @@ class GenericCrudRepository:
         data_q = data_q.offset(offset).limit(limit)
         rows = self.db.execute(data_q).mappings().all()
 
+        items = []
+        for row in rows:
+            item = dict(row)
+            total = item.pop(_TOTAL_LABEL)
+            items.append(item)
+
+        if not rows:
+            # Past the last page (or empty): no row to read the total from
+            total = 0
+            if offset > 0:
+                count_q = select(func.count()).select_from(table).where(base_where)
+                count_q = self._apply_filters(count_q, table, filters)
+                total = self.db.execute(count_q).scalar() or 0
+
         return {
-            "items": [dict(row) for row in rows],
+            "items": items,
             "total": total,
             "offset": offset,
             "limit": limit,
@@ -204,10 +218,11 @@ class GenericCrudRepository:
             # still increment to keep the counter moving
             updates["version"] = table.c.version + 1
 
-        stmt = stmt.values(**updates)
-        result = self.db.execute(stmt)
+        # RETURNING hands back the updated row in the same round-trip
+        stmt = stmt.values(**updates).returning(*table.c)
+        row = self.db.execute(stmt).mappings().first()
 
-        if result.rowcount == 0:
+        if row is None:
             # Distinguish "not found" from "version conflict"
             if has_ver and expected_version is not None:
                 # Check if the row exists at all
@@ -221,14 +236,7 @@ class GenericCrudRepository:
                     raise StaleDataError(entity_id, expected_version)
             return None
 
-        # Return the updated row
-        row = self.db.execute(
-            select(table)
-            .where(table.c.id == entity_id)
-            .where(table.c.tenant_id == tenant_id)
-        ).mappings().first()
-
-        return dict(row) if row else None
+        return dict(row)
 
     def delete(
         self,
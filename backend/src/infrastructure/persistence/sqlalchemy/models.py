@@ -10,13 +10,15 @@ from sqlalchemy import (
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
     Text,
     UniqueConstraint,
+    text,
 )
-from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy.dialects.postgresql import JSON, JSONB
 from sqlalchemy.orm import DeclarativeBase
 
 
@@ -58,6 +60,11 @@ class PageVersionModel(Base):
             "page_key", "scope", "tenant_id", "version_number",
             name="uq_page_version",
         ),
+        Index(
+            "ix_page_versions_published",
+            "page_key", "tenant_id", text("version_number DESC"),
+            postgresql_where=text("status = 'published'"),
+        ),
     )
 
     id = Column(String(36), primary_key=True)
@@ -89,6 +96,16 @@ class PageVersionModel(Base):
 
 class ProductModel(Base):
     __tablename__ = "products"
+    __table_args__ = (
+        Index(
+            "ix_products_ean", "tenant_id", "ean",
+            unique=True,
+            postgresql_where=text("ean IS NOT NULL"),
+        ),
+        Index("ix_products_ncm", "ncm_codigo"),
+        Index("ix_products_cest", "cest_codigo"),
+        Index("ix_products_cclass", "cclass_codigo"),
+    )
 
     id = Column(String(36), primary_key=True)
     tenant_id = Column(String(36), nullable=False, index=True)
@@ -102,7 +119,7 @@ class ProductModel(Base):
     ncm_codigo = Column(String(8), nullable=True)
     cest_codigo = Column(String(7), nullable=True)
     cclass_codigo = Column(String(16), nullable=True)
-    custom_fields = Column(JSON, nullable=True)
+    custom_fields = Column(JSONB, nullable=True)
 
     # ── Extended product fields ──────────────────────────────────
     description = Column(Text, nullable=True)  # commercial description
@@ -173,14 +190,18 @@ class WorkflowModel(Base):
         UniqueConstraint(
             "tenant_id", "command", name="uq_workflow_tenant_command",
         ),
+        Index(
+            "ix_workflows_published", "tenant_id", "command",
+            postgresql_where=text("status = 'published'"),
+        ),
     )
 
     id = Column(String(36), primary_key=True)
-    tenant_id = Column(String(36), nullable=False, index=True)
+    tenant_id = Column(String(36), nullable=False)
     name = Column(String(255), nullable=False)
     command = Column(String(64), nullable=False, index=True)
     description = Column(Text, nullable=True)
-    steps = Column(JSON, nullable=False, default=list)
+    steps = Column(JSONB, nullable=False, default=list)
     status = Column(
         String(16),
         nullable=False,
@@ -217,7 +238,7 @@ class SkillModel(Base):
     tenant_id = Column(String(36), nullable=False, index=True)
     name = Column(String(64), nullable=False, index=True)
     description = Column(Text, nullable=False)
-    params_schema = Column(JSON, nullable=False, default=dict)
+    params_schema = Column(JSONB, nullable=False, default=dict)
     category = Column(String(32), nullable=False, server_default="general")
     enabled = Column(Boolean, nullable=False, default=True)
     version = Column(Integer, nullable=False, default=1)
@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Optional
 
-from sqlalchemy import and_, select
+from sqlalchemy import and_, case, or_, select
 from sqlalchemy.orm import Session
 
 from src.domain.entities.page_version import PageVersion, Scope, VersionStatus
@@ -15,6 +15,8 @@ from src.infrastructure.persistence.sqlalchemy.models import PageVersionModel
 class PageRepositoryImpl:
     """Concrete implementation of the PageRepository port using SQLAlchemy."""
 
+    __slots__ = ("_session",)
+
     def __init__(self, session: Session) -> None:
         self._session = session
 
@@ -82,6 +84,49 @@ class PageRepositoryImpl:
         model = self._session.execute(stmt).scalar_one_or_none()
         return self._to_entity(model) if model else None
 
+    def get_published_resolved(
+        self,
+        page_key: str,
+        tenant_id: Optional[str] = None,
+    ) -> Optional[PageVersion]:
+        """Return the tenant-scoped published version, else the global one.
+
+        Both candidates are fetched in a single round-trip; tenant scope
+        wins over global, then the highest version_number.
+        """
+        global_cond = and_(
+            PageVersionModel.scope == Scope.GLOBAL.value,
+            PageVersionModel.tenant_id.is_(None),
+        )
+        scope_cond = global_cond
+        if tenant_id:
+            scope_cond = or_(
+                and_(
+                    PageVersionModel.scope == Scope.TENANT.value,
+                    PageVersionModel.tenant_id == tenant_id,
+                ),
+                global_cond,
+            )
+
+        stmt = (
+            select(PageVersionModel)
+            .where(
+                PageVersionModel.page_key == page_key,
+                PageVersionModel.status == VersionStatus.PUBLISHED.value,
+                scope_cond,
+            )
+            .order_by(
+                case(
+                    (PageVersionModel.scope == Scope.TENANT.value, 0),
+                    else_=1,
+                ),
+                PageVersionModel.version_number.desc(),
+            )
+            .limit(1)
+        )
+        model = self._session.execute(stmt).scalar_one_or_none()
+        return self._to_entity(model) if model else None
+
     def get_versions(
         self,
         page_key: str,
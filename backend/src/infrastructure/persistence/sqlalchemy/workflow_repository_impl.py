@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from sqlalchemy import select
+from sqlalchemy import insert, select, update
 from sqlalchemy.orm import Session
 
 from src.application.ports.workflow_repository_port import (
@@ -90,34 +90,39 @@ class SqlAlchemyWorkflowRepository(WorkflowRepositoryInterface):
         row = self._db.execute(stmt).scalar_one_or_none()
         return self._to_entity(row) if row else None
 
+    def _row_values(self, workflow: Workflow) -> dict:
+        return {
+            "name": workflow.name,
+            "command": workflow.command,
+            "description": workflow.description,
+            "steps": self._steps_to_dicts(workflow.steps),
+            "status": workflow.status.value,
+            "version": workflow.version,
+        }
+
     def create(self, workflow: Workflow) -> Workflow:
-        model = WorkflowModel(
-            id=workflow.id,
-            tenant_id=workflow.tenant_id,
-            name=workflow.name,
-            command=workflow.command,
-            description=workflow.description,
-            steps=self._steps_to_dicts(workflow.steps),
-            status=workflow.status.value,
-            version=workflow.version,
+        # Steps are a JSONB column: the whole workflow is one INSERT,
+        # issued directly rather than through the unit of work.
+        self._db.execute(
+            insert(WorkflowModel).values(
+                id=workflow.id,
+                tenant_id=workflow.tenant_id,
+                **self._row_values(workflow),
+            )
         )
-        self._db.add(model)
-        self._db.flush()
         return workflow
 
     def update(self, workflow: Workflow) -> Workflow:
-        stmt = select(WorkflowModel).where(
-            WorkflowModel.id == workflow.id,
-            WorkflowModel.tenant_id == workflow.tenant_id,
+        # Single UPDATE ... RETURNING instead of SELECT-then-flush
+        stmt = (
+            update(WorkflowModel)
+            .where(
+                WorkflowModel.id == workflow.id,
+                WorkflowModel.tenant_id == workflow.tenant_id,
+            )
+            .values(**self._row_values(workflow))
+            .returning(WorkflowModel.id)
         )
-        model = self._db.execute(stmt).scalar_one_or_none()
-        if model is None:
+        if self._db.execute(stmt).first() is None:
             raise ValueError(f"Workflow {workflow.id} not found.")
-        model.name = workflow.name
-        model.command = workflow.command
-        model.description = workflow.description
-        model.steps = self._steps_to_dicts(workflow.steps)
-        model.status = workflow.status.value
-        model.version = workflow.version
-        self._db.flush()
         return workflow
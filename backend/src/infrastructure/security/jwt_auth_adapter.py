@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import hashlib
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
+from threading import Lock
 from typing import Optional
 
 from jose import JWTError, jwt
@@ -11,8 +15,17 @@ from src.application.ports.auth_port import AuthContext
 from src.infrastructure.config.settings import settings
 
 
+# Max number of verified tokens kept in memory (LRU eviction)
+_VERIFY_CACHE_MAXSIZE = 4096
+
+
 class JWTAuthAdapter:
-    """Concrete implementation of AuthPort using python-jose."""
+    """Concrete implementation of AuthPort using python-jose.
+
+    Successful verifications are memoized per token (keyed by a BLAKE2b
+    digest, never the raw token) until the token's own ``exp``, so
+    repeat requests with the same bearer skip the HMAC + JSON decode.
+    """
 
     def __init__(
         self,
@@ -23,6 +36,11 @@ class JWTAuthAdapter:
         self._secret = secret
         self._algorithm = algorithm
         self._expire_minutes = expire_minutes
+        # digest -> (AuthContext, exp timestamp)
+        self._verify_cache: OrderedDict[bytes, tuple[AuthContext, float]] = (
+            OrderedDict()
+        )
+        self._verify_lock = Lock()
 
     def create_token(
         self,
@@ -44,11 +62,22 @@ class JWTAuthAdapter:
         return jwt.encode(payload, self._secret, algorithm=self._algorithm)
 
     def verify_token(self, token: str) -> Optional[AuthContext]:
+        key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+        now = time.time()
+
+        with self._verify_lock:
+            cached = self._verify_cache.get(key)
+            if cached is not None:
+                if cached[1] > now:
+                    self._verify_cache.move_to_end(key)
+                    return cached[0]
+                del self._verify_cache[key]
+
         try:
             payload = jwt.decode(
                 token, self._secret, algorithms=[self._algorithm]
             )
-            return AuthContext(
+            ctx = AuthContext(
                 user_id=payload["sub"],
                 tenant_id=payload["tenant_id"],
                 username=payload["username"],
@@ -56,3 +85,11 @@ class JWTAuthAdapter:
             )
         except JWTError:
             return None
+
+        exp = payload.get("exp")
+        if exp is not None:
+            with self._verify_lock:
+                self._verify_cache[key] = (ctx, float(exp))
+                if len(self._verify_cache) > _VERIFY_CACHE_MAXSIZE:
+                    self._verify_cache.popitem(last=False)
+        return ctx
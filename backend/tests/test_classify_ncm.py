@@ -10,6 +10,8 @@ import sys
 import types
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 # Stub web_search module to avoid bs4 dependency during import
 if "src.application.agent.skills.web_search" not in sys.modules:
     _ws_stub = types.ModuleType("src.application.agent.skills.web_search")
@@ -20,15 +22,50 @@ if "bs4" not in sys.modules:
     _bs4.BeautifulSoup = MagicMock()  # type: ignore[attr-defined]
     sys.modules["bs4"] = _bs4
 
+from src.application.agent.skills import classify_ncm as classify_ncm_module  # noqa: E402
+from src.application.agent.skills.classify_ncm import classify_ncm  # noqa: E402
+
+_MODULE = "src.application.agent.skills.classify_ncm"
+
 
 # ── Helpers ──────────────────────────────────────────────────────────
 
 def _make_fake_db(rows: list[dict]):
+    """A Session whose engine hands out a connection returning ``rows``.
+
+    ``classify_ncm`` queries on its own connection from
+    ``db.get_bind().engine``, as plain ``(codigo, descricao, sujeito_is)``
+    tuples. ``db.conn`` is that connection, for call assertions.
+    """
+    conn = MagicMock()
+    conn.execute.side_effect = lambda stmt, binds: [
+        (r["codigo"], r["descricao"], r.get("sujeito_is", False)) for r in rows
+    ]
     db = MagicMock()
-    db.execute.return_value.mappings.return_value.all.return_value = rows
+    db.get_bind.return_value.engine.connect.return_value.__enter__.return_value = conn
+    db.conn = conn
     return db
 
 
+def _run(params: dict, db, ncm_table=None):
+    """Run classify_ncm with a fake ``ncm`` table and SELECT builder."""
+    fake_select = MagicMock()
+    fake_stmt = MagicMock()
+    fake_select.return_value = fake_stmt
+    fake_stmt.where.return_value = fake_stmt
+    fake_stmt.limit.return_value = fake_stmt
+
+    with (
+        patch(f"{_MODULE}.Base") as mock_base,
+        patch(f"{_MODULE}.select", fake_select),
+    ):
+        mock_base.metadata.tables.get.return_value = (
+            MagicMock() if ncm_table is None else ncm_table
+        )
+        result = asyncio.run(classify_ncm(params, {"db": db}))
+    return result, mock_base.metadata.tables.get
+
+
 NCM_REFRIGERANTE = {
     "codigo": "22029010",
     "descricao": "Refrigerantes",
@@ -39,34 +76,40 @@ NCM_QUEIJO = {
     "descricao": "Queijo fresco (não curado), incluindo requeijão",
 }
 
+NCM_GASOLINA = {
+    "codigo": "27101259",
+    "descricao": "Gasolina automotiva",
+    "sujeito_is": True,
+}
+
+
+@pytest.fixture(autouse=True)
+def _reset_module_state():
+    """Result caches, the resolved table and built statements are global."""
+    def _clear():
+        with classify_ncm_module._cache_lock:
+            classify_ncm_module._hit_cache.clear()
+            classify_ncm_module._miss_cache.clear()
+        classify_ncm_module._ncm_table = None
+        classify_ncm_module._search_stmt.cache_clear()
+
+    _clear()
+    yield
+    _clear()
 
-# ── Tests ────────────────────────────────────────────────────────────
+
+# ── Search ───────────────────────────────────────────────────────────
 
 def test_search_by_category_returns_candidates():
     """ILIKE on categoria should return matching NCM candidates."""
     fake_db = _make_fake_db([NCM_REFRIGERANTE])
 
-    fake_select = MagicMock()
-    fake_stmt = MagicMock()
-    fake_select.return_value = fake_stmt
-    fake_stmt.where.return_value = fake_stmt
-    fake_stmt.limit.return_value = fake_stmt
+    result, _ = _run({"categoria": "refrigerante"}, fake_db)
 
-    async def _run():
-        with (
-            patch("src.application.agent.skills.classify_ncm.Base") as mock_base,
-            patch("src.application.agent.skills.classify_ncm.select", fake_select),
-        ):
-            mock_base.metadata.tables.get.return_value = MagicMock()
-            from src.application.agent.skills.classify_ncm import classify_ncm
-            return await classify_ncm(
-                {"categoria": "refrigerante"},
-                {"db": fake_db},
-            )
-
-    result = asyncio.run(_run())
-    assert result["candidates"]
-    assert result["candidates"][0]["codigo"] == "22029010"
+    assert result["candidates"] == [
+        {"codigo": "22029010", "descricao": "Refrigerantes", "sujeito_is": False},
+    ]
+    assert "tipo_produto" not in result
 
 
 def test_multi_word_category():
@@ -76,48 +119,42 @@ def test_multi_word_category():
         "descricao": "Carne bovina desossada, fresca ou refrigerada",
     }])
 
-    fake_select = MagicMock()
-    fake_stmt = MagicMock()
-    fake_select.return_value = fake_stmt
-    fake_stmt.where.return_value = fake_stmt
-    fake_stmt.limit.return_value = fake_stmt
+    result, _ = _run({"categoria": "carne bovina"}, fake_db)
 
-    async def _run():
-        with (
-            patch("src.application.agent.skills.classify_ncm.Base") as mock_base,
-            patch("src.application.agent.skills.classify_ncm.select", fake_select),
-        ):
-            mock_base.metadata.tables.get.return_value = MagicMock()
-            from src.application.agent.skills.classify_ncm import classify_ncm
-            return await classify_ncm(
-                {"categoria": "carne bovina"},
-                {"db": fake_db},
-            )
-
-    result = asyncio.run(_run())
     assert result["candidates"]
     assert "02013000" == result["candidates"][0]["codigo"]
+    # Every term must match: one ILIKE bind per word, plus the limit
+    _, binds = fake_db.conn.execute.call_args.args
+    assert binds == {"term_0": "%carne%", "term_1": "%bovina%", "max_results": 5}
+
+
+def test_search_uses_own_connection_not_request_session():
+    fake_db = _make_fake_db([NCM_QUEIJO])
+
+    _run({"categoria": "queijo"}, fake_db)
+
+    fake_db.conn.execute.assert_called_once()
+    fake_db.execute.assert_not_called()
+
+
+def test_fuel_candidate_hints_tipo_produto():
+    fake_db = _make_fake_db([NCM_GASOLINA])
+
+    result, _ = _run({"categoria": "gasolina"}, fake_db)
+
+    assert result["tipo_produto"] == "combustivel"
 
 
 def test_empty_category_returns_empty():
     """Empty category should return empty candidates."""
-    async def _run():
-        with patch("src.application.agent.skills.classify_ncm.Base"):
-            from src.application.agent.skills.classify_ncm import classify_ncm
-            return await classify_ncm({"categoria": ""}, {"db": MagicMock()})
-
-    result = asyncio.run(_run())
+    result, _ = _run({"categoria": ""}, MagicMock())
     assert result == {"candidates": []}
 
 
 def test_no_db_returns_error():
     """Missing db in context should return an error."""
-    async def _run():
-        with patch("src.application.agent.skills.classify_ncm.Base"):
-            from src.application.agent.skills.classify_ncm import classify_ncm
-            return await classify_ncm({"categoria": "refrigerante"}, {})
-
-    result = asyncio.run(_run())
+    with patch(f"{_MODULE}.Base"):
+        result = asyncio.run(classify_ncm({"categoria": "refrigerante"}, {}))
     assert "error" in result
 
 
@@ -125,23 +162,73 @@ def test_no_matches_returns_empty_candidates():
     """Query with no matches should return empty candidates list."""
     fake_db = _make_fake_db([])
 
-    fake_select = MagicMock()
-    fake_stmt = MagicMock()
-    fake_select.return_value = fake_stmt
-    fake_stmt.where.return_value = fake_stmt
-    fake_stmt.limit.return_value = fake_stmt
+    result, _ = _run({"categoria": "xyznotexist"}, fake_db)
 
-    async def _run():
-        with (
-            patch("src.application.agent.skills.classify_ncm.Base") as mock_base,
-            patch("src.application.agent.skills.classify_ncm.select", fake_select),
-        ):
-            mock_base.metadata.tables.get.return_value = MagicMock()
-            from src.application.agent.skills.classify_ncm import classify_ncm
-            return await classify_ncm(
-                {"categoria": "xyznotexist"},
-                {"db": fake_db},
-            )
-
-    result = asyncio.run(_run())
     assert result["candidates"] == []
+
+
+# ── Result caches ────────────────────────────────────────────────────
+
+def test_repeated_category_is_served_from_cache():
+    fake_db = _make_fake_db([NCM_REFRIGERANTE])
+
+    first, _ = _run({"categoria": "refrigerante"}, fake_db)
+    second, _ = _run({"categoria": "refrigerante"}, fake_db)
+
+    assert second == first
+    assert fake_db.conn.execute.call_count == 1
+
+
+def test_cache_key_ignores_case_and_spacing():
+    fake_db = _make_fake_db([NCM_QUEIJO])
+
+    _run({"categoria": "Queijo  Fresco"}, fake_db)
+    _run({"categoria": "queijo fresco"}, fake_db)
+
+    assert fake_db.conn.execute.call_count == 1
+
+
+def test_cache_key_includes_max_results():
+    fake_db = _make_fake_db([NCM_QUEIJO])
+
+    _run({"categoria": "queijo"}, fake_db)
+    _run({"categoria": "queijo", "max_results": 10}, fake_db)
+
+    assert fake_db.conn.execute.call_count == 2
+
+
+def test_empty_results_go_to_miss_cache():
+    fake_db = _make_fake_db([])
+
+    _run({"categoria": "xyznotexist"}, fake_db)
+    _run({"categoria": "xyznotexist"}, fake_db)
+
+    assert fake_db.conn.execute.call_count == 1
+    assert len(classify_ncm_module._miss_cache) == 1
+    assert len(classify_ncm_module._hit_cache) == 0
+
+
+# ── ncm table resolution ─────────────────────────────────────────────
+
+def test_ncm_table_is_resolved_once():
+    fake_db = _make_fake_db([NCM_REFRIGERANTE])
+    ncm_table = MagicMock()
+
+    _, tables_get = _run({"categoria": "refrigerante"}, fake_db, ncm_table)
+    tables_get.assert_called_once_with("ncm")
+    _, tables_get = _run({"categoria": "queijo"}, fake_db, ncm_table)
+    tables_get.assert_not_called()
+
+
+def test_missing_ncm_table_is_not_remembered():
+    fake_db = _make_fake_db([NCM_REFRIGERANTE])
+
+    with patch(f"{_MODULE}.Base") as mock_base:
+        mock_base.metadata.tables.get.return_value = None
+        result = asyncio.run(
+            classify_ncm({"categoria": "refrigerante"}, {"db": fake_db})
+        )
+    assert "error" in result
+
+    result, _ = _run({"categoria": "refrigerante"}, fake_db)
+    assert result["candidates"]
@@ -0,0 +1,105 @@
+"""Tests for orchestrator helpers — reply parsing and streamed reading.
+
+Uses a fake LLM provider; no network required.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+from src.application.agent.orchestrator import (
+    _ObjectScanner,
+    _complete_streamed,
+    _parse_llm_response,
+)
+
+
+# ── Helpers ──────────────────────────────────────────────────────────
+
+class _FakeStreamLLM:
+    """Yields fixed chunks and records how far the stream was read."""
+
+    def __init__(self, chunks: list[str]):
+        self.chunks = chunks
+        self.consumed = 0
+        self.closed = False
+
+    async def stream(self, messages: list[dict]):
+        try:
+            for chunk in self.chunks:
+                self.consumed += 1
+                yield chunk
+        finally:
+            self.closed = True
+
+
+def _feed_all(chunks: list[str]) -> list[bool]:
+    scanner = _ObjectScanner()
+    return [scanner.feed(chunk) for chunk in chunks]
+
+
+# ── _ObjectScanner ───────────────────────────────────────────────────
+
+def test_scanner_closes_on_outer_brace():
+    assert _feed_all(['{"a": {"b": 1}', "}"]) == [False, True]
+
+
+def test_scanner_ignores_braces_inside_strings():
+    assert _feed_all(['{"a": "}{', '\\"}"', "}"]) == [False, False, True]
+
+
+def test_scanner_skips_fence_before_object():
+    assert _feed_all(["```json\n", '{"a": 1}']) == [False, True]
+
+
+# ── _complete_streamed ───────────────────────────────────────────────
+
+def test_stream_stops_once_object_closes():
+    llm = _FakeStreamLLM(['```json\n{"action": ', '"final"}', "\n```", "stray prose"])
+
+    raw = asyncio.run(_complete_streamed(llm, []))
+
+    assert raw == '```json\n{"action": "final"}'
+    assert llm.consumed == 2
+    assert llm.closed
+
+
+def test_stream_without_object_reads_to_end():
+    llm = _FakeStreamLLM(["no json ", "here"])
+
+    raw = asyncio.run(_complete_streamed(llm, []))
+
+    assert raw == "no json here"
+    assert llm.consumed == 2
+    assert llm.closed
+
+
+# ── _parse_llm_response ──────────────────────────────────────────────
+
+def test_parse_strips_markdown_fence():
+    assert _parse_llm_response('```json\n{"action": "final"}\n```') == {"action": "final"}
+
+
+def test_parse_repairs_trailing_commas():
+    raw = '{"action": "final", "draft": {"tags": ["a", "b",],},}'
+    assert _parse_llm_response(raw) == {
+        "action": "final",
+        "draft": {"tags": ["a", "b"]},
+    }
+
+
+def test_parse_repairs_bare_keys():
+    raw = '{action: "classify_ncm", params: {categoria: "queijo"}}'
+    assert _parse_llm_response(raw) == {
+        "action": "classify_ncm",
+        "params": {"categoria": "queijo"},
+    }
+
+
+def test_parse_repair_leaves_string_contents_alone():
+    raw = '{"note": "a,} {b: 1,]", extra: "x",}'
+    assert _parse_llm_response(raw) == {"note": "a,} {b: 1,]", "extra": "x"}
+
+
+def test_parse_unrepairable_returns_none():
+    assert _parse_llm_response("Sorry, I cannot help with that.") is None
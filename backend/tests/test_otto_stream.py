@@ -0,0 +1,36 @@
+"""Tests for Otto's incremental decoding of streamed ``message`` replies."""
+
+from __future__ import annotations
+
+from src.application.otto.orchestrator import _MessageStream
+
+
+def _feed_all(chunks: list[str]) -> list[str]:
+    stream = _MessageStream()
+    return [stream.feed(chunk) for chunk in chunks]
+
+
+def test_message_text_is_emitted_per_chunk():
+    deltas = _feed_all(['```json\n{"mess', 'age": "Olá, ', 'tudo bem?"', ', "action": null}'])
+    assert deltas == ["", "Olá, ", "tudo bem?", ""]
+
+
+def test_escape_cut_by_chunk_is_held_back():
+    deltas = _feed_all(['{"message": "linha\\', 'nnova \\u00', 'e7\\u00e3o"}'])
+    assert "".join(deltas) == "linha\nnova ção"
+    assert deltas[0] == "linha"
+
+
+def test_surrogate_pair_is_decoded_whole():
+    deltas = _feed_all(['{"message": "ok \\ud83d', '\\ude00"}'])
+    assert deltas == ["ok ", "\U0001F600"]
+
+
+def test_reply_without_leading_message_key_emits_nothing():
+    deltas = _feed_all(['{"action": "list_entities", ', '"message": "Listando"}'])
+    assert deltas == ["", ""]
+
+
+def test_text_after_closing_quote_is_ignored():
+    deltas = _feed_all(['{"message": "fim"', ', "message": "de novo"}'])
+    assert deltas == ["fim", ""]
@@ -0,0 +1,95 @@
+"""Tests for page_schema_events — schema cache invalidation on commits.
+
+Runs against an in-memory SQLite database holding only ``page_versions``.
+"""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.adapters.http import llm_provider_cache
+from src.adapters.http.page_schema_events import enable_page_schema_invalidation
+from src.adapters.http.routers import generic_crud_router
+from src.infrastructure.persistence.sqlalchemy.models import PageVersionModel
+
+TENANT = "00000000-0000-0000-0000-000000000001"
+CACHE_KEY = (TENANT, "produtos", None)
+
+
+@pytest.fixture()
+def session_factory():
+    engine = create_engine("sqlite://")
+    PageVersionModel.__table__.create(engine)
+    factory = sessionmaker(bind=engine)
+    enable_page_schema_invalidation(factory)
+    yield factory
+    engine.dispose()
+
+
+@pytest.fixture(autouse=True)
+def cached_schema():
+    with llm_provider_cache._lock:
+        llm_provider_cache._schema_cache[CACHE_KEY] = {"title": "old"}
+    with generic_crud_router._schema_cache_lock:
+        generic_crud_router._schema_cache["produtos"] = object()
+    yield
+    with llm_provider_cache._lock:
+        llm_provider_cache._schema_cache.clear()
+    with generic_crud_router._schema_cache_lock:
+        generic_crud_router._schema_cache.clear()
+
+
+def _new_version(page_key: str = "produtos") -> PageVersionModel:
+    return PageVersionModel(
+        id="v1", page_key=page_key, scope="global", version_number=1,
+        schema_json={"title": "new"}, status="published",
+    )
+
+
+def _is_cached() -> bool:
+    with llm_provider_cache._lock:
+        agent_cached = CACHE_KEY in llm_provider_cache._schema_cache
+    with generic_crud_router._schema_cache_lock:
+        crud_cached = "produtos" in generic_crud_router._schema_cache
+    assert agent_cached == crud_cached
+    return agent_cached
+
+
+# ── Tests ────────────────────────────────────────────────────────────
+
+def test_commit_invalidates_page_schema(session_factory):
+    with session_factory() as db:
+        db.add(_new_version())
+        db.commit()
+    assert not _is_cached()
+
+
+def test_update_commit_invalidates_page_schema(session_factory):
+    with session_factory() as db:
+        db.add(_new_version())
+        db.commit()
+        with llm_provider_cache._lock:
+            llm_provider_cache._schema_cache[CACHE_KEY] = {"title": "old"}
+        with generic_crud_router._schema_cache_lock:
+            generic_crud_router._schema_cache["produtos"] = object()
+
+        db.get(PageVersionModel, "v1").status = "archived"
+        db.commit()
+    assert not _is_cached()
+
+
+def test_rollback_keeps_cache(session_factory):
+    with session_factory() as db:
+        db.add(_new_version())
+        db.flush()
+        db.rollback()
+    assert _is_cached()
+
+
+def test_other_page_is_left_alone(session_factory):
+    with session_factory() as db:
+        db.add(_new_version("clientes"))
+        db.commit()
+    assert _is_cached()
@@ -0,0 +1,106 @@
+"""Tests for response_cache.coalesce — sharing in-flight LLM calls.
+
+Uses a fake LLM provider and fake fetch coroutines; no network required.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from src.application.agent import response_cache
+
+
+# ── Helpers ──────────────────────────────────────────────────────────
+
+class _FakeLLM:
+    model = "fake-model"
+    cache_enabled = True
+
+
+class _NoCacheLLM(_FakeLLM):
+    cache_enabled = False
+
+
+MESSAGES = [{"role": "user", "content": "Enriquecer 7891000315507"}]
+
+
+def _counting_fetch(result: str = '{"action": "final"}'):
+    """Return a fetch callable that yields once and counts its calls."""
+    calls = []
+
+    async def fetch() -> str:
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return result
+
+    return fetch, calls
+
+
+# ── Tests ────────────────────────────────────────────────────────────
+
+def test_concurrent_identical_calls_fetch_once():
+    fetch, calls = _counting_fetch()
+
+    async def _run():
+        return await asyncio.gather(
+            *(response_cache.coalesce(_FakeLLM(), MESSAGES, fetch) for _ in range(3))
+        )
+
+    results = asyncio.run(_run())
+    assert results == ['{"action": "final"}'] * 3
+    assert len(calls) == 1
+    assert response_cache._inflight == {}
+
+
+def test_leader_exception_reaches_followers():
+    async def failing_fetch() -> str:
+        await asyncio.sleep(0.01)
+        raise RuntimeError("LLM down")
+
+    async def _run():
+        return await asyncio.gather(
+            response_cache.coalesce(_FakeLLM(), MESSAGES, failing_fetch),
+            response_cache.coalesce(_FakeLLM(), MESSAGES, failing_fetch),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(_run())
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert response_cache._inflight == {}
+
+
+def test_leader_cancellation_makes_follower_fetch_itself():
+    fetch, calls = _counting_fetch()
+
+    async def _run():
+        leader = asyncio.create_task(
+            response_cache.coalesce(_FakeLLM(), MESSAGES, fetch)
+        )
+        await asyncio.sleep(0)  # leader registers its in-flight future
+        follower = asyncio.create_task(
+            response_cache.coalesce(_FakeLLM(), MESSAGES, fetch)
+        )
+        await asyncio.sleep(0)  # follower starts waiting on it
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    assert asyncio.run(_run()) == '{"action": "final"}'
+    assert len(calls) == 2
+    assert response_cache._inflight == {}
+
+
+def test_cache_disabled_does_not_coalesce():
+    fetch, calls = _counting_fetch()
+
+    async def _run():
+        return await asyncio.gather(
+            response_cache.coalesce(_NoCacheLLM(), MESSAGES, fetch),
+            response_cache.coalesce(_NoCacheLLM(), MESSAGES, fetch),
+        )
+
+    asyncio.run(_run())
+    assert len(calls) == 2
@@ -0,0 +1,72 @@
+"""Tests for get_stream_user — JWT source precedence for SSE endpoints.
+
+Token verification is mocked; no database or signing key required.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+from src.adapters.http.dependency_injection import (
+    STREAM_AUTH_COOKIE,
+    get_stream_user,
+)
+
+
+# ── Helpers ──────────────────────────────────────────────────────────
+
+def _request(cookie: str | None = None):
+    request = MagicMock()
+    request.cookies = {STREAM_AUTH_COOKIE: cookie} if cookie else {}
+    return request
+
+
+def _bearer(token: str) -> HTTPAuthorizationCredentials:
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+def _resolve(request, credentials=None, token=None):
+    """Run get_stream_user and return the raw token it verified."""
+    with patch(
+        "src.adapters.http.dependency_injection.auth_adapter"
+    ) as mock_adapter:
+        mock_adapter.verify_token.side_effect = lambda raw: {"raw": raw}
+        get_stream_user(request, credentials, token)
+    return mock_adapter.verify_token.call_args.args[0]
+
+
+# ── Tests ────────────────────────────────────────────────────────────
+
+def test_bearer_header_wins_over_cookie_and_query():
+    raw = _resolve(_request("cookie-jwt"), _bearer("header-jwt"), "query-jwt")
+    assert raw == "header-jwt"
+
+
+def test_cookie_used_without_bearer_header():
+    raw = _resolve(_request("cookie-jwt"), None, "query-jwt")
+    assert raw == "cookie-jwt"
+
+
+def test_query_token_is_last_resort():
+    raw = _resolve(_request(), None, "query-jwt")
+    assert raw == "query-jwt"
+
+
+def test_missing_token_is_401():
+    with pytest.raises(HTTPException) as exc:
+        get_stream_user(_request(), None, None)
+    assert exc.value.status_code == 401
+
+
+def test_invalid_token_is_401():
+    with patch(
+        "src.adapters.http.dependency_injection.auth_adapter"
+    ) as mock_adapter:
+        mock_adapter.verify_token.return_value = None
+        with pytest.raises(HTTPException) as exc:
+            get_stream_user(_request("stale-jwt"), None, None)
+    assert exc.value.status_code == 401
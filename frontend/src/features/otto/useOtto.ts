@@ -92,7 +92,7 @@ export function useOtto(): UseOttoReturn {
     const token = useAuthStore.getState().token;
     const history = buildHistory(currentMessages);
 
-    const url = `/api/otto/stream?token=${encodeURIComponent(token || '')}`;
+    const url = '/api/otto/stream';
     const body = JSON.stringify({
       input,
       page_key: pageKey || null,
@@ -102,7 +102,10 @@ export function useOtto(): UseOttoReturn {
     try {
       const response = await fetch(url, {
         method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
+        headers: {
+          'Content-Type': 'application/json',
+          ...(token ? { Authorization: `Bearer ${token}` } : {}),
+        },
         body,
         signal: controller.signal,
       });
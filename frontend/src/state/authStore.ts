@@ -29,13 +29,16 @@ export const useAuthStore = create<AuthState>()(
           username: data.username,
           role: data.role,
         }),
-      logout: () =>
+      logout: () => {
+        // Expire the httpOnly stream cookie; JS cannot clear it itself.
+        fetch('/api/auth/logout', { method: 'POST' }).catch(() => {});
         set({
           token: null,
           tenantId: null,
           username: null,
           role: null,
-        }),
+        });
+      },
     }),
     { name: 'erp-dsl-auth' }
   )